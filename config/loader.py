@@ -5,23 +5,91 @@ Handles loading environment configurations from YAML files or falling back
 to legacy .env files for backward compatibility.
 """
 
+import logging
 import os
 from pathlib import Path
 from typing import Optional
 
-import yaml
 from dotenv import load_dotenv
 
 from models.environment import EnvironmentConfig, EnvironmentsConfiguration
 from utils.logger import logger
 
+_REQUIRED_ENV_VARS = ('DATABRICKS_HOST', 'DATABRICKS_TOKEN', 'DATABRICKS_HTTP_PATH')
 
-def load_from_yaml(file_path: str) -> EnvironmentsConfiguration:
+
+def _stat_or_none(path: str) -> Optional[os.stat_result]:
+    """Return os.stat(path), or None if the path does not exist."""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def _read_bytes(path: str, size: Optional[int] = None) -> bytes:
+    """
+    Read a whole file with raw os.read calls, bypassing buffered text IO.
+
+    Args:
+        path: File to read
+        size: Expected size in bytes (from an earlier stat), if known
+
+    Returns:
+        File contents as bytes
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if size is None:
+            size = os.fstat(fd).st_size
+        # Ask for one extra byte to detect a file that grew since it was stat-ed
+        data = os.read(fd, size + 1)
+        if len(data) <= size:
+            return data
+        chunks = [data]
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return b''.join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
+def config_fingerprint(
+    yaml_file: str = 'environments.yaml',
+    env_file: str = '.env'
+) -> tuple:
+    """
+    Build a cheap change-detection key for the configuration files.
+
+    Args:
+        yaml_file: Path to YAML config file
+        env_file: Path to .env file
+
+    Returns:
+        Tuple of (path, st_mtime_ns, st_size, st_ino) per file, with None
+        in place of the stat fields for missing files
+    """
+    fingerprint = []
+    for path in (yaml_file, env_file):
+        st = _stat_or_none(path)
+        fingerprint.append(
+            (path, None) if st is None
+            else (path, st.st_mtime_ns, st.st_size, st.st_ino)
+        )
+    return tuple(fingerprint)
+
+
+def load_from_yaml(
+    file_path: str,
+    _stat: Optional[os.stat_result] = None
+) -> EnvironmentsConfiguration:
     """
     Load and validate environments configuration from YAML file.
 
     Args:
         file_path: Path to environments.yaml file
+        _stat: Stat result already obtained by the caller, used to size the read
 
     Returns:
         Validated EnvironmentsConfiguration object
@@ -31,30 +99,39 @@ def load_from_yaml(file_path: str) -> EnvironmentsConfiguration:
         ValueError: If YAML is invalid or validation fails
         yaml.YAMLError: If YAML parsing fails
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"Configuration file not found: {file_path}")
+    # Imported lazily so .env-only deployments never pay for PyYAML
+    import yaml
+
+    # Prefer the libyaml-backed loader; fall back to the pure-Python one
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+    # Let the read report a missing file rather than stat-ing it first
+    try:
+        content = _read_bytes(file_path, _stat.st_size if _stat is not None else None)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {file_path}") from None
 
     logger.info(f"Loading configuration from {file_path}")
 
     try:
-        with open(file_path, 'r') as f:
-            data = yaml.safe_load(f)
+        data = yaml.load(content, Loader=loader)
 
         if not data:
             raise ValueError(f"Configuration file is empty: {file_path}")
 
-        # Parse environment configs
-        env_configs = {}
-        for name, env_data in data.get('environments', {}).items():
-            # Ensure name is set in the environment data
+        # Ensure name is set in each environment's data
+        environments = data.get('environments') or {}
+        for name, env_data in environments.items():
+            if not isinstance(env_data, dict):
+                raise ValueError(f"Environment '{name}' must be a mapping of settings")
             env_data['name'] = name
-            env_configs[name] = EnvironmentConfig(**env_data)
 
-        # Create configuration object with validation
-        config = EnvironmentsConfiguration(
-            default=data.get('default'),
-            environments=env_configs
-        )
+        # Validate the whole tree in one pass so every environment is
+        # checked by pydantic-core without a Python-level call per entry
+        config = EnvironmentsConfiguration.model_validate({
+            'default': data.get('default'),
+            'environments': environments
+        })
 
         logger.info(
             f"Configuration loaded: {file_path} "
@@ -70,7 +147,10 @@ def load_from_yaml(file_path: str) -> EnvironmentsConfiguration:
         raise
 
 
-def load_from_env(env_file: str = '.env') -> EnvironmentsConfiguration:
+def load_from_env(
+    env_file: str = '.env',
+    _stat: Optional[os.stat_result] = None
+) -> EnvironmentsConfiguration:
     """
     Load configuration from legacy .env file.
 
@@ -79,6 +159,7 @@ def load_from_env(env_file: str = '.env') -> EnvironmentsConfiguration:
 
     Args:
         env_file: Path to .env file (default: .env)
+        _stat: Stat result already obtained by the caller (skips the existence check)
 
     Returns:
         EnvironmentsConfiguration with single "default" environment
@@ -87,30 +168,33 @@ def load_from_env(env_file: str = '.env') -> EnvironmentsConfiguration:
         FileNotFoundError: If .env file doesn't exist
         ValueError: If required environment variables are missing
     """
-    if not os.path.exists(env_file):
+    if _stat is None and not os.path.exists(env_file):
         raise FileNotFoundError(f"Environment file not found: {env_file}")
 
     logger.warning(
         f"environments.yaml not found, using legacy .env configuration from {env_file}"
     )
 
-    # Load environment variables from .env file
-    load_dotenv(env_file)
+    # Load environment variables from .env file. load_dotenv never overrides
+    # variables that are already set, so skip parsing when all are exported.
+    env = os.environ
+    if not all(var in env for var in _REQUIRED_ENV_VARS):
+        load_dotenv(env_file)
 
     # Get required variables
-    host = os.getenv('DATABRICKS_HOST')
-    token = os.getenv('DATABRICKS_TOKEN')
-    http_path = os.getenv('DATABRICKS_HTTP_PATH')
-
-    if not all([host, token, http_path]):
-        missing = []
-        if not host:
-            missing.append('DATABRICKS_HOST')
-        if not token:
-            missing.append('DATABRICKS_TOKEN')
-        if not http_path:
-            missing.append('DATABRICKS_HTTP_PATH')
-
+    host = env.get('DATABRICKS_HOST')
+    token = env.get('DATABRICKS_TOKEN')
+    http_path = env.get('DATABRICKS_HTTP_PATH')
+
+    missing = [
+        var for var, value in (
+            ('DATABRICKS_HOST', host),
+            ('DATABRICKS_TOKEN', token),
+            ('DATABRICKS_HTTP_PATH', http_path),
+        )
+        if not value
+    ]
+    if missing:
         raise ValueError(
             f"Missing required environment variables in {env_file}: "
             f"{', '.join(missing)}"
@@ -128,7 +212,7 @@ def load_from_env(env_file: str = '.env') -> EnvironmentsConfiguration:
     # Create configuration with single environment
     config = EnvironmentsConfiguration(
         default='default',
-        environments={'default': default_env}
+        environments={default_env.name: default_env}
     )
 
     logger.info(f"Configuration loaded: {env_file} (1 environment, backward compatibility mode)")
@@ -160,28 +244,34 @@ def auto_load_configuration(
         FileNotFoundError: If neither configuration file exists
         ValueError: If configuration is invalid
     """
-    # DEBUG: Log current working directory and file paths
-    cwd = os.getcwd()
-    yaml_full_path = os.path.abspath(yaml_file)
-    env_full_path = os.path.abspath(env_file)
-    logger.info(f"DEBUG: Current working directory: {cwd}")
-    logger.info(f"DEBUG: Looking for YAML file: {yaml_full_path} (exists: {os.path.exists(yaml_file)})")
-    logger.info(f"DEBUG: Looking for ENV file: {env_full_path} (exists: {os.path.exists(env_file)})")
-    
+    # Debug details cost extra syscalls, so only gather them when they'll be logged
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Current working directory: {os.getcwd()}")
+        logger.debug(
+            f"Looking for YAML file: {os.path.abspath(yaml_file)} "
+            f"(exists: {os.path.exists(yaml_file)})"
+        )
+        logger.debug(
+            f"Looking for ENV file: {os.path.abspath(env_file)} "
+            f"(exists: {os.path.exists(env_file)})"
+        )
+
     # First, try to load from YAML
-    if os.path.exists(yaml_file):
-        # Warn if both files exist
-        if os.path.exists(env_file):
+    yaml_stat = _stat_or_none(yaml_file)
+    if yaml_stat is not None:
+        # Warn if both files exist (the extra stat only matters if the warning is emitted)
+        if logger.isEnabledFor(logging.WARNING) and _stat_or_none(env_file) is not None:
             logger.warning(
                 f"Both {yaml_file} and {env_file} exist. "
                 f"Using {yaml_file} (preferred). "
                 f"Consider removing {env_file} if no longer needed."
             )
-        return load_from_yaml(yaml_file)
+        return load_from_yaml(yaml_file, _stat=yaml_stat)
 
     # Fall back to .env
-    if os.path.exists(env_file):
-        return load_from_env(env_file)
+    env_stat = _stat_or_none(env_file)
+    if env_stat is not None:
+        return load_from_env(env_file, _stat=env_stat)
 
     # No configuration found
     raise FileNotFoundError(
@@ -1,50 +1,228 @@
 """
 Environment manager for handling environment switching and state management.
 
-Implements a singleton pattern to maintain a single active environment state
-across the MCP server lifetime.
+A single module-level manager instance, obtained through get_manager(),
+maintains the active environment state across the MCP server lifetime.
 """
 
-from typing import Dict, Optional
-from datetime import datetime
+import threading
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional, Tuple
 
 from models.environment import (
     EnvironmentConfig,
     EnvironmentsConfiguration,
-    ActiveEnvironment
+    ActiveEnvironment,
+    build_credentials
 )
-from config.loader import auto_load_configuration
+from config.loader import auto_load_configuration, config_fingerprint
 from utils.logger import logger, mask_token
 
 
+@dataclass(frozen=True, slots=True)
+class _CachedEnv:
+    """Immutable connection details for one environment, built once per load."""
+
+    name: str
+    host: str
+    http_path: str
+    token: Optional[str]
+    profile: Optional[str]
+    credentials: Mapping[str, str]
+    switch_message: str
+
+    @classmethod
+    def from_config(cls, config: EnvironmentConfig) -> '_CachedEnv':
+        """Snapshot an EnvironmentConfig and precompute its credentials and switch message."""
+        switch_message = '\n'.join((
+            f"✓ Switched to environment: {config.name}",
+            f"Host: {config.host}",
+            f"Description: {config.description or 'N/A'}",
+            f"Tags: {', '.join(config.tags) if config.tags else 'N/A'}",
+        ))
+
+        return cls(
+            name=config.name,
+            host=config.host,
+            http_path=config.http_path,
+            token=config.token,
+            profile=config.profile,
+            credentials=build_credentials(config),
+            switch_message=switch_message
+        )
+
+
+class _UnloadedState:
+    """Manager state before any configuration has been loaded.
+
+    Each state implements every accessor, either returning a value or
+    raising, so the manager dispatches without checking for None.
+    """
+
+    configuration: Optional[EnvironmentsConfiguration] = None
+    active_environment: Optional[ActiveEnvironment] = None
+
+    def get_configuration(self) -> EnvironmentsConfiguration:
+        raise RuntimeError(
+            "Configuration not loaded. Call load_configuration() first."
+        )
+
+    def get_credentials(self) -> Dict[str, str]:
+        raise RuntimeError(
+            "No active environment set. Call set_active_to_default() or "
+            "switch_to_environment() first."
+        )
+
+    def get_name(self) -> Optional[str]:
+        return None
+
+    def get_info(self) -> str:
+        raise RuntimeError("No active environment set.")
+
+
+class _LoadedState(_UnloadedState):
+    """Configuration loaded, but no environment active yet."""
+
+    def __init__(
+        self,
+        configuration: EnvironmentsConfiguration,
+        cached_envs: Dict[str, _CachedEnv]
+    ):
+        self.configuration = configuration
+        self.cached_envs = cached_envs
+        # Only needed for error messages, but cheap to build once per load
+        self.available_names = ', '.join(cached_envs)
+
+    def get_configuration(self) -> EnvironmentsConfiguration:
+        return self.configuration
+
+
+class _ActiveState(_LoadedState):
+    """Configuration loaded and an environment active."""
+
+    def __init__(
+        self,
+        configuration: EnvironmentsConfiguration,
+        cached_envs: Dict[str, _CachedEnv],
+        active_environment: ActiveEnvironment
+    ):
+        super().__init__(configuration, cached_envs)
+        self.active_environment = active_environment
+        self.credentials = active_environment.credentials
+        # Summary is formatted on first request; a switch or reload builds a new state
+        self.info: Optional[str] = None
+
+    def get_credentials(self) -> Dict[str, str]:
+        # A copy, so callers can't alter the environment's shared credentials
+        return dict(self.credentials)
+
+    def get_name(self) -> Optional[str]:
+        return self.active_environment.name
+
+    def get_info(self) -> str:
+        if self.info is None:
+            self.info = self.active_environment.to_summary()
+        return self.info
+
+
+# Most recently parsed YAML configuration as (fingerprint, configuration),
+# shared so every manager in the process reuses it while the files are unchanged
+_parsed_cache: Optional[Tuple[tuple, EnvironmentsConfiguration]] = None
+
+
+def _load_or_reuse(
+    yaml_file: str,
+    env_file: str,
+    fingerprint: tuple
+) -> EnvironmentsConfiguration:
+    """Return the cached configuration if its files are unchanged, else load it."""
+    global _parsed_cache
+    cached = _parsed_cache
+    if cached is not None and cached[0] == fingerprint:
+        logger.debug(f"Reusing parsed configuration for {yaml_file}")
+        return cached[1]
+
+    configuration = auto_load_configuration(yaml_file, env_file)
+    # Only YAML results are reusable: .env loading also depends on os.environ,
+    # which the file fingerprint doesn't capture
+    yaml_present = fingerprint[0][1] is not None
+    _parsed_cache = (fingerprint, configuration) if yaml_present else None
+    return configuration
+
+
 class EnvironmentManager:
     """
-    Singleton manager for environment configuration and switching.
+    Manager for environment configuration and switching.
 
     Maintains the active environment state and provides methods for
     loading configurations, switching environments, and retrieving
-    credentials for Databricks connections.
+    credentials for Databricks connections. The server shares the
+    instance returned by get_manager().
     """
 
-    _instance = None
+    def __init__(self):
+        """Initialize the environment manager."""
+        self._state: _UnloadedState = _UnloadedState()
+        self._config_fingerprint: Optional[tuple] = None
+        logger.info("EnvironmentManager initialized")
 
-    def __new__(cls):
-        """Ensure only one instance exists (singleton pattern)."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            # Initialize instance variables
-            cls._instance._initialized = False
-        return cls._instance
+    @property
+    def _configuration(self) -> Optional[EnvironmentsConfiguration]:
+        """The loaded configuration, or None before load_configuration()."""
+        return self._state.configuration
 
-    def __init__(self):
-        """Initialize the environment manager (only once)."""
-        if self._initialized:
-            return
+    def _set_configuration(
+        self,
+        configuration: EnvironmentsConfiguration,
+        fingerprint: tuple,
+        fall_back_to_default: bool = False
+    ) -> None:
+        """
+        Install a freshly loaded configuration and rebuild the per-environment cache.
 
-        self._configuration: Optional[EnvironmentsConfiguration] = None
-        self._active_environment: Optional[ActiveEnvironment] = None
-        self._initialized = True
-        logger.info("EnvironmentManager initialized")
+        The active environment is carried over if it still exists (keeping its
+        activation when its settings are unchanged). The new state is built in
+        full and assigned once, so concurrent readers never see the manager
+        without an active environment in between.
+
+        Args:
+            configuration: The newly loaded configuration
+            fingerprint: File fingerprint the configuration was loaded from
+            fall_back_to_default: Activate the default environment if the
+                active one no longer exists
+
+        Raises:
+            KeyError: If falling back and the default environment doesn't exist
+        """
+        cached_envs = {
+            name: _CachedEnv.from_config(config)
+            for name, config in configuration.environments.items()
+        }
+
+        old_active = self._state.active_environment
+        if old_active is not None and old_active.name in configuration:
+            name = old_active.name
+        elif old_active is not None and fall_back_to_default:
+            name = configuration.default
+        else:
+            name = None
+
+        if name is None:
+            state = _LoadedState(configuration, cached_envs)
+        else:
+            config = configuration[name]
+            if name == old_active.name and config == old_active.config:
+                active = old_active
+            else:
+                active = ActiveEnvironment(
+                    name=name,
+                    config=config,
+                    credentials=cached_envs[name].credentials
+                )
+            state = _ActiveState(configuration, cached_envs, active)
+
+        self._state = state
+        self._config_fingerprint = fingerprint
 
     def load_configuration(
         self,
@@ -54,6 +232,10 @@ class EnvironmentManager:
         """
         Load environment configuration from YAML or .env file.
 
+        A previously active environment stays active if it still exists in
+        the new configuration; otherwise call set_active_to_default()
+        afterwards.
+
         Args:
             yaml_file: Path to YAML config file
             env_file: Path to .env file
@@ -63,7 +245,10 @@ class EnvironmentManager:
             ValueError: If configuration is invalid
         """
         try:
-            self._configuration = auto_load_configuration(yaml_file, env_file)
+            fingerprint = config_fingerprint(yaml_file, env_file)
+            self._set_configuration(
+                _load_or_reuse(yaml_file, env_file, fingerprint), fingerprint
+            )
             logger.info(
                 f"Loaded {len(self._configuration.environments)} environment(s)"
             )
@@ -71,6 +256,19 @@ class EnvironmentManager:
             logger.error(f"Failed to load configuration: {e}")
             raise
 
+    def _activate(self, name: str, config: EnvironmentConfig) -> None:
+        """Make an environment active, reusing its cached connection credentials."""
+        state = self._state
+        self._state = _ActiveState(
+            state.configuration,
+            state.cached_envs,
+            ActiveEnvironment(
+                name=name,
+                config=config,
+                credentials=state.cached_envs[name].credentials
+            )
+        )
+
     def set_active_to_default(self) -> None:
         """
         Set the active environment to the configured default.
@@ -79,19 +277,12 @@ class EnvironmentManager:
             RuntimeError: If configuration not loaded
             ValueError: If default environment is invalid
         """
-        if not self._configuration:
-            raise RuntimeError(
-                "Configuration not loaded. Call load_configuration() first."
-            )
+        configuration = self._state.get_configuration()
 
-        default_name = self._configuration.default
-        default_config = self._configuration.get_default_environment()
+        default_name = configuration.default
+        default_config = configuration.get_default_environment()
 
-        self._active_environment = ActiveEnvironment(
-            name=default_name,
-            config=default_config,
-            activated_at=datetime.now()
-        )
+        self._activate(default_name, default_config)
 
         logger.info(
             f"Active environment set to default: {default_name} "
@@ -115,29 +306,22 @@ class EnvironmentManager:
             RuntimeError: If configuration not loaded
             ValueError: If environment doesn't exist or has invalid credentials
         """
-        if not self._configuration:
-            raise RuntimeError(
-                "Configuration not loaded. Call load_configuration() first."
-            )
+        state = self._state
+        configuration = state.get_configuration()
 
         # Check if environment exists
-        target_env = self._configuration.get_environment(name)
-        if not target_env:
-            available = ', '.join(self._configuration.list_environment_names())
+        target = state.cached_envs.get(name)
+        if target is None:
             raise ValueError(
                 f"Environment '{name}' not found. "
-                f"Available environments: {available}"
+                f"Available environments: {state.available_names}"
             )
 
         # Store old environment for logging
-        old_name = self._active_environment.name if self._active_environment else None
+        old_name = state.get_name()
 
         # Switch to new environment
-        self._active_environment = ActiveEnvironment(
-            name=name,
-            config=target_env,
-            activated_at=datetime.now()
-        )
+        self._activate(name, configuration[name])
 
         # Log the switch
         if old_name and old_name != name:
@@ -145,31 +329,39 @@ class EnvironmentManager:
         else:
             logger.info(f"Environment set to: {name}")
 
-        # Return success message with details
-        return (
-            f"✓ Switched to environment: {name}\n"
-            f"Host: {target_env.host}\n"
-            f"Description: {target_env.description or 'N/A'}\n"
-            f"Tags: {', '.join(target_env.tags) if target_env.tags else 'N/A'}"
-        )
+        # Return success message with details (precomputed at load time)
+        return target.switch_message
 
     def get_active_credentials(self) -> Optional[Dict[str, str]]:
         """
         Get credentials for the currently active environment.
 
+        Each call returns a fresh copy of the environment's credentials, so
+        callers may change it without affecting other callers.
+
         Returns:
-            Dictionary with host, token, and http_path keys, or None if no active environment
+            Dictionary with host, http_path, and token or profile keys
 
         Raises:
             RuntimeError: If no active environment is set
         """
-        if not self._active_environment:
-            raise RuntimeError(
-                "No active environment set. Call set_active_to_default() or "
-                "switch_to_environment() first."
-            )
+        return self._state.get_credentials()
+
+    def get_active_snapshot(self) -> Tuple[Optional[str], Dict[str, str]]:
+        """
+        Get the active environment's name and credentials together.
+
+        Both come from the same state, so a concurrent switch can't pair
+        one environment's name with another's credentials.
+
+        Returns:
+            Tuple of (environment name, credentials dictionary)
 
-        return self._active_environment.get_credentials()
+        Raises:
+            RuntimeError: If no active environment is set
+        """
+        state = self._state
+        return state.get_name(), state.get_credentials()
 
     def get_active_environment_name(self) -> Optional[str]:
         """
@@ -178,9 +370,7 @@ class EnvironmentManager:
         Returns:
             Environment name, or None if no active environment
         """
-        if not self._active_environment:
-            return None
-        return self._active_environment.name
+        return self._state.get_name()
 
     def get_active_environment_info(self) -> str:
         """
@@ -192,25 +382,23 @@ class EnvironmentManager:
         Raises:
             RuntimeError: If no active environment is set
         """
-        if not self._active_environment:
-            raise RuntimeError("No active environment set.")
-
-        return self._active_environment.to_summary()
+        return self._state.get_info()
 
     def list_all_environments(self) -> Dict[str, EnvironmentConfig]:
         """
         Get all configured environments.
 
+        The parsed configuration is shared between managers, so this returns
+        a copy of its environments dict; the EnvironmentConfig values are
+        frozen and shared as-is.
+
         Returns:
             Dictionary of environment name to EnvironmentConfig
 
         Raises:
             RuntimeError: If configuration not loaded
         """
-        if not self._configuration:
-            raise RuntimeError("Configuration not loaded.")
-
-        return self._configuration.environments
+        return dict(self._state.get_configuration().environments)
 
     def reload_configuration(
         self,
@@ -221,7 +409,8 @@ class EnvironmentManager:
         Reload configuration from file (used by file watcher).
 
         If the current active environment no longer exists after reload,
-        resets to default environment.
+        resets to default environment. Skips parsing entirely when the
+        configuration files are unchanged since the last load.
 
         Args:
             yaml_file: Path to YAML config file
@@ -231,29 +420,35 @@ class EnvironmentManager:
             ValueError: If new configuration is invalid
         """
         try:
-            old_active = self._active_environment.name if self._active_environment else None
-
-            # Load new configuration
-            self._configuration = auto_load_configuration(yaml_file, env_file)
+            fingerprint = config_fingerprint(yaml_file, env_file)
+            if self._configuration is not None and fingerprint == self._config_fingerprint:
+                logger.debug(f"Configuration unchanged, skipping reload: {yaml_file}")
+                return
+
+            old_state = self._state
+            old_active = old_state.get_name()
+
+            # Load new configuration, carrying over or resetting the active
+            # environment in the same state change
+            self._set_configuration(
+                _load_or_reuse(yaml_file, env_file, fingerprint),
+                fingerprint,
+                fall_back_to_default=True
+            )
             logger.warning(f"Configuration file changed, reloading: {yaml_file}")
 
-            # Check if active environment still exists
-            if old_active and old_active not in self._configuration.environments:
+            new_state = self._state
+            if old_active and new_state.get_name() != old_active:
                 logger.warning(
                     f"Active environment '{old_active}' no longer exists in "
                     f"configuration. Resetting to default: "
-                    f"{self._configuration.default}"
+                    f"{new_state.get_name()}"
                 )
-                self.set_active_to_default()
             elif old_active:
-                # Update active environment with new configuration
-                new_config = self._configuration.get_environment(old_active)
-                self._active_environment = ActiveEnvironment(
-                    name=old_active,
-                    config=new_config,
-                    activated_at=datetime.now()
-                )
-                logger.info(f"Active environment '{old_active}' updated with new configuration")
+                if new_state.active_environment is old_state.active_environment:
+                    logger.debug(f"Active environment '{old_active}' unchanged by reload")
+                else:
+                    logger.info(f"Active environment '{old_active}' updated with new configuration")
 
             logger.info("Configuration reload successful")
 
@@ -263,3 +458,34 @@ class EnvironmentManager:
                 f"Keeping current configuration."
             )
             # Don't raise - keep current configuration on error
+
+
+_manager = EnvironmentManager()
+_init_lock = threading.Lock()
+
+
+def get_manager() -> EnvironmentManager:
+    """Get the shared EnvironmentManager instance."""
+    return _manager
+
+
+def get_initialized_manager() -> EnvironmentManager:
+    """
+    Get the shared EnvironmentManager, loading it on first use.
+
+    The first call loads the configuration and activates the default
+    environment; later calls return the manager without touching the
+    files. Concurrent first calls load the configuration only once.
+
+    Raises:
+        FileNotFoundError: If no configuration file found
+        ValueError: If configuration is invalid
+    """
+    manager = _manager
+    if manager.get_active_environment_name() is None:
+        with _init_lock:
+            if manager.get_active_environment_name() is None:
+                logger.info("Environment manager not initialized, initializing now...")
+                manager.load_configuration()
+                manager.set_active_to_default()
+    return manager
@@ -4,11 +4,42 @@ Validation utilities for environment configurations.
 Provides functions to validate credential completeness and format.
 """
 
-from typing import List, Optional
+from typing import Iterable, Optional, Tuple
+
 from models.environment import EnvironmentConfig
 
+_VALIDATION_ERROR_TEMPLATE = (
+    "Environment '{name}' has incomplete credentials.\n"
+    "Missing required fields: {fields}\n\n"
+    "Please update your environments.yaml file to include all required fields:\n"
+    "  - host: Your Databricks workspace hostname\n"
+    "  - token: Your Databricks personal access token\n"
+    "  - http_path: SQL warehouse HTTP path"
+)
+
+
+def _blank(value: Optional[str]) -> bool:
+    """Return True for None, empty, or whitespace-only strings without copying them."""
+    return not value or value.isspace()
+
+
+def _missing_fields(
+    host: Optional[str],
+    token: Optional[str],
+    http_path: Optional[str]
+) -> Tuple[str, ...]:
+    """Names of the blank required fields, in host, token, http_path order."""
+    return tuple(
+        field for field, value in (
+            ('host', host),
+            ('token', token),
+            ('http_path', http_path),
+        )
+        if _blank(value)
+    )
+
 
-def validate_credentials_complete(env: EnvironmentConfig) -> tuple[bool, Optional[List[str]]]:
+def validate_credentials_complete(env: EnvironmentConfig) -> Tuple[bool, Tuple[str, ...]]:
     """
     Validate that an environment has all required credentials.
 
@@ -18,42 +49,24 @@ def validate_credentials_complete(env: EnvironmentConfig) -> tuple[bool, Optiona
     Returns:
         Tuple of (is_valid, missing_fields)
         - is_valid: True if all required fields are present and non-empty
-        - missing_fields: List of missing field names, or None if all present
+        - missing_fields: Tuple of missing field names, empty if all present
     """
-    missing = []
-
-    if not env.host or env.host.strip() == '':
-        missing.append('host')
-
-    if not env.token or env.token.strip() == '':
-        missing.append('token')
-
-    if not env.http_path or env.http_path.strip() == '':
-        missing.append('http_path')
-
-    if missing:
-        return False, missing
-
-    return True, None
+    missing = _missing_fields(env.host, env.token, env.http_path)
+    return not missing, missing
 
 
-def get_validation_error_message(env_name: str, missing_fields: List[str]) -> str:
+def get_validation_error_message(env_name: str, missing_fields: Iterable[str]) -> str:
     """
     Generate a user-friendly error message for missing credentials.
 
     Args:
         env_name: Name of the environment with missing fields
-        missing_fields: List of missing field names
+        missing_fields: Missing field names, as returned by validate_credentials_complete
 
     Returns:
         Formatted error message with actionable guidance
     """
-    fields_str = ', '.join(missing_fields)
-    return (
-        f"Environment '{env_name}' has incomplete credentials.\n"
-        f"Missing required fields: {fields_str}\n\n"
-        f"Please update your environments.yaml file to include all required fields:\n"
-        f"  - host: Your Databricks workspace hostname\n"
-        f"  - token: Your Databricks personal access token\n"
-        f"  - http_path: SQL warehouse HTTP path"
+    return _VALIDATION_ERROR_TEMPLATE.format(
+        name=env_name,
+        fields=', '.join(missing_fields)
     )
@@ -1,7 +1,9 @@
-from typing import Dict, Any
-from databricks.sql import connect
-from databricks.sql.client import Connection
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, TypeVar
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.core import Config
 from databricks.sdk.service.compute import (
     AutoScale,
     DataSecurityMode,
@@ -9,8 +11,23 @@ from databricks.sdk.service.compute import (
 )
 from mcp.server.fastmcp import FastMCP
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import configparser
+import functools
+import itertools
+import json
 import logging
+import os
+import re
+import shutil
+import subprocess
 import sys
+import threading
+import time
+
+if TYPE_CHECKING:
+    from databricks.sql.client import Connection
 
 # CRITICAL FIX: Remove all existing handlers and force everything to stderr
 for handler in logging.root.handlers[:]:
@@ -26,46 +43,389 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Import environment management
-from config.manager import EnvironmentManager
+from config.manager import EnvironmentManager, get_initialized_manager
 from tools.switch_environment import switch_environment
 from tools.get_current_environment import get_current_environment
+from utils.logger import configure_logging
 
-# Initialize environment manager as None - will be lazily loaded
-env_manager = None
-
-# Initialize WorkspaceClient with error handling
-# Note: WorkspaceClient will be lazily initialized when needed
-w = None
+# WorkspaceClient is lazily initialized when needed and cached as
+# (credentials key, client) so switching environments replaces it
+_workspace: Optional[Tuple[tuple, WorkspaceClient]] = None
+_ws_lock = threading.Lock()
 
 # Set up the MCP server
 mcp = FastMCP("Databricks API Explorer")
 
+# Shared HTTP session so REST calls reuse pooled keep-alive connections
+_http = requests.Session()
+_http.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.1,
+            status_forcelist=(429, 500, 502, 503, 504)
+        )
+    )
+)
+
+# REST API base URL per workspace host, and headers sent with every request
+_base_url_cache: Dict[str, str] = {}
+_API_HEADERS = {"Content-Type": "application/json"}
+
+# CLI tokens cached per profile as (access_token, expiry on the time.monotonic() clock)
+_token_cache: Dict[str, Tuple[str, float]] = {}
+# Guards _token_cache updates and _profile_token_locks; never held across the CLI
+_token_lock = threading.Lock()
+# One lock per profile, held while that profile's CLI subprocess runs
+_profile_token_locks: Dict[str, threading.Lock] = {}
+# SDK Config per profile; each caches and refreshes its own OAuth/CLI token
+_sdk_configs: Dict[str, Config] = {}
+# Worker threads for fanning out independent REST calls over the pooled session
+_api_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="dbx-api")
+# Seconds to wait for in-process SDK authentication before giving up
+_SDK_AUTH_TIMEOUT = 10
+# Profile auth types that resolve from config alone and can never wait on a browser
+_NON_INTERACTIVE_AUTH_TYPES = frozenset({
+    "pat", "basic", "oauth-m2m", "azure-client-secret",
+    "google-credentials", "google-id",
+})
+
+# Absolute path of the databricks CLI, resolved on first use
+_resolved_databricks_cmd: Optional[str] = None
+# HTTP status for a rejected token; only this evicts cached auth
+_HTTP_UNAUTHORIZED = 401
+# Refresh cached tokens this many seconds before they expire
+_TOKEN_SKEW = 60
+# Assumed token lifetime when the CLI reports no usable expiry; kept short
+# because the CLI may hand back a cached token that is close to expiring
+_DEFAULT_TOKEN_TTL = 300
+# The CLI's expiry as Go formats it: optional fraction up to nanoseconds,
+# then 'Z', a numeric offset, or nothing for local time
+_EXPIRY_RE = re.compile(
+    r"(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2})(?:\.(\d+))?"
+    r"(Z|[+-]\d{2}:?\d{2})?"
+)
+
+# Rows pulled from the SQL warehouse per fetch, and the most run_sql_query returns
+_SQL_FETCH_SIZE = 1000
+_SQL_MAX_ROWS = 10000
+# Most rows list_jobs and list_clusters include before summarizing the rest
+_LIST_MAX_ROWS = 500
+# Task-type keys of a Jobs API task definition
+_TASK_KINDS = frozenset({
+    "notebook_task", "spark_jar_task", "spark_python_task", "spark_submit_task",
+    "python_wheel_task", "sql_task", "pipeline_task", "run_job_task", "dbt_task",
+    "condition_task", "for_each_task",
+})
+# Markdown table row template and cell separator for query results
+_ROW_FMT = "| {} |\n"
+_SEP = " | "
+# Display format for Jobs API timestamps
+_TIME_FMT = '%Y-%m-%d %H:%M:%S'
+
+# Job API responses keyed by (function, environment, host, *args) -> (expiry, value),
+# least recently used first
+_job_cache: "OrderedDict[tuple, Tuple[float, Any]]" = OrderedDict()
+_job_cache_lock = threading.Lock()
+_JOB_CACHE_MAX = 256
+
+# Formatted table listings keyed by environment name -> (expiry, text)
+_schema_cache: Dict[Optional[str], Tuple[float, str]] = {}
+_SCHEMA_TTL = 60
+
 
 def get_env_manager() -> EnvironmentManager:
-    """Get or initialize the environment manager lazily."""
-    global env_manager
-    if env_manager is None:
-        env_manager = EnvironmentManager()
+    """Get the shared environment manager, loading it on first use.
+
+    Shares get_initialized_manager() with the environment tools, so a
+    switch made through either is seen by both.
+    """
+    return get_initialized_manager()
+
+
+def _active_snapshot() -> Tuple[Optional[str], Dict[str, str]]:
+    """Get the active environment's (name, credentials) in a single manager call."""
+    return get_env_manager().get_active_snapshot()
+
+
+T = TypeVar('T')
+
+
+def run_with_timeout(func: Callable[[], T], timeout_seconds: float) -> T:
+    """Run func on its own daemon thread and wait at most timeout_seconds.
+
+    Python threads can't be cancelled, so a call that hangs (e.g. an OAuth
+    login waiting on a browser) is abandoned rather than stopped. Giving
+    each call its own daemon thread keeps abandoned calls from starving
+    later ones or blocking interpreter exit.
+
+    Raises:
+        TimeoutError: If func doesn't finish in time
+    """
+    outcome: Dict[str, Any] = {}
+
+    def target() -> None:
+        try:
+            outcome['value'] = func()
+        except BaseException as e:
+            outcome['error'] = e
+
+    thread = threading.Thread(target=target, name="dbx-auth", daemon=True)
+    thread.start()
+    thread.join(timeout_seconds)
+    if thread.is_alive():
+        raise TimeoutError(
+            f"Operation timed out after {timeout_seconds}s "
+            f"(authentication may be waiting for interactive login)"
+        )
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['value']
+
+
+@functools.lru_cache(maxsize=4)
+def _read_databricks_config(path: str, mtime_ns: int) -> Optional[configparser.ConfigParser]:
+    """Parse a .databrickscfg once per modification time; None if it's malformed.
+
+    The returned parser is shared between callers and must not be modified.
+    """
+    parser = configparser.ConfigParser()
+    try:
+        parser.read(path)
+    except configparser.Error:
+        return None
+    return parser
+
+
+def _profile_auth_is_noninteractive(profile: str) -> bool:
+    """Check ~/.databrickscfg for a profile whose auth can't block on a login.
+
+    Profiles with an explicit non-interactive auth_type, or with a token or
+    client secret and no auth_type, authenticate from config alone. Anything
+    else (missing profile, OAuth U2M, CLI or browser auth) may block.
+    """
+    config_file = os.environ.get("DATABRICKS_CONFIG_FILE") or os.path.expanduser("~/.databrickscfg")
+    try:
+        mtime_ns = os.stat(config_file).st_mtime_ns
+    except OSError:
+        return False
+    parser = _read_databricks_config(config_file, mtime_ns)
+    if parser is None:
+        return False
+    if profile != parser.default_section and not parser.has_section(profile):
+        return False
+
+    section = parser[profile]
+    auth_type = section.get("auth_type")
+    if auth_type:
+        return auth_type in _NON_INTERACTIVE_AUTH_TYPES
+    return bool(
+        section.get("token")
+        or section.get("client_secret")
+        or (section.get("username") and section.get("password"))
+    )
+
+
+def run_profile_auth(profile: str, func: Callable[[], T]) -> T:
+    """Run an SDK auth call for a profile, bounding it only if it could block."""
+    if _profile_auth_is_noninteractive(profile):
+        return func()
+    return run_with_timeout(func, _SDK_AUTH_TIMEOUT)
+
+
+def _parse_cli_expiry(expiry: str) -> datetime:
+    """Parse the CLI's RFC 3339 expiry, which fromisoformat rejects before 3.11.
+
+    Raises:
+        ValueError: If the timestamp isn't in a recognized format
+    """
+    match = _EXPIRY_RE.fullmatch(expiry.strip())
+    if match is None:
+        raise ValueError(expiry)
+    base, fraction, offset = match.groups()
+    parsed = datetime.strptime(base.replace(' ', 'T'), '%Y-%m-%dT%H:%M:%S')
+    if fraction:
+        # Go prints up to nanoseconds; datetime keeps microseconds
+        parsed = parsed.replace(microsecond=int(fraction[:6].ljust(6, '0')))
+    if offset == 'Z':
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    elif offset:
+        sign = -1 if offset[0] == '-' else 1
+        digits = offset[1:].replace(':', '')
+        delta = timedelta(hours=int(digits[:2]), minutes=int(digits[2:]))
+        parsed = parsed.replace(tzinfo=timezone(sign * delta))
+    return parsed
+
+
+def _expiry_to_monotonic(expiry: Optional[str]) -> float:
+    """Convert the CLI's token expiry into a time.monotonic() deadline."""
+    now = time.monotonic()
+    if expiry:
+        try:
+            return now + _parse_cli_expiry(expiry).timestamp() - time.time()
+        except ValueError:
+            logger.warning(f"Unrecognized token expiry from databricks CLI: {expiry}")
+    return now + _DEFAULT_TOKEN_TTL
+
+
+def _evict_profile_token(profile: str) -> None:
+    """Forget a profile's cached tokens after the workspace rejected one.
+
+    Drops the CLI token, the profile's SDK Config and, if it was built for
+    this profile, the cached WorkspaceClient, whose auth _current_bearer uses.
+    """
+    global _workspace
+    with _token_lock:
+        _token_cache.pop(profile, None)
+    _sdk_configs.pop(profile, None)
+    with _ws_lock:
+        cached = _workspace
+        if cached is not None and ('profile', profile) in cached[0]:
+            _workspace = None
+
+
+def _is_unauthorized(error: BaseException) -> bool:
+    """Check whether a SQL connector error means the workspace rejected the token."""
+    context = getattr(error, 'context', None)
+    return isinstance(context, dict) and context.get('http-code') == _HTTP_UNAUTHORIZED
+
+
+def _databricks_cli() -> str:
+    """Resolve the databricks CLI on PATH once and remember it.
+
+    Raises:
+        FileNotFoundError: If the CLI is not on PATH (not cached, so a later
+            install is picked up)
+    """
+    global _resolved_databricks_cmd
+    if _resolved_databricks_cmd is None:
+        path = shutil.which('databricks')
+        if path is None:
+            raise FileNotFoundError("databricks")
+        _resolved_databricks_cmd = path
+    return _resolved_databricks_cmd
+
+
+def _profile_token_lock(profile: str) -> threading.Lock:
+    """Get the lock serializing CLI token fetches for one profile."""
+    with _token_lock:
+        return _profile_token_locks.setdefault(profile, threading.Lock())
+
+
+def get_token_from_cli(profile: str) -> str:
+    """Get an access token for a profile from the databricks CLI.
+
+    Tokens are cached in-process per profile and reused until shortly before
+    they expire, so the CLI subprocess only runs on first use and on refresh.
+    A per-profile lock keeps concurrent tool calls from spawning duplicate
+    CLIs without making other profiles wait behind a slow one.
+    """
+    cached = _token_cache.get(profile)
+    if cached and time.monotonic() < cached[1] - _TOKEN_SKEW:
+        return cached[0]
+
+    with _profile_token_lock(profile):
+        # Another caller may have refreshed it while we waited
+        cached = _token_cache.get(profile)
+        if cached and time.monotonic() < cached[1] - _TOKEN_SKEW:
+            return cached[0]
+
+        # Use databricks CLI to get the token
+        # The CLI auth returns a JSON object with access_token, token_type, expiry, etc.
+        # No --force-refresh: the CLI serves its own cached token and only goes to
+        # the identity provider when that token has expired
         try:
-            env_manager.load_configuration()
-            env_manager.set_active_to_default()
-            logger.info("Environment manager initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize environment manager: {e}")
-            raise
-    return env_manager
+            result = subprocess.run(
+                [_databricks_cli(), 'auth', 'token', '--profile', profile],
+                capture_output=True,
+                timeout=30,
+                check=True
+            )
+
+            # Parse the JSON response (json.loads takes the raw bytes, no decode pass)
+            token_data = json.loads(result.stdout)
+            token = token_data['access_token']
+            logger.info(f"Successfully obtained token from CLI (expires: {token_data.get('expiry', 'N/A')})")
+
+        except subprocess.CalledProcessError as e:
+            logger.error(
+                f"Failed to get token from databricks CLI: "
+                f"{e.stderr.decode(errors='replace') if e.stderr else ''}"
+            )
+            raise ValueError(
+                f"Failed to authenticate using profile '{profile}'. "
+                f"Ensure 'databricks' CLI is installed and configured."
+            )
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse token from CLI output: {e}")
+            raise ValueError(
+                f"Invalid token format from databricks CLI for profile '{profile}'"
+            )
+        except FileNotFoundError:
+            logger.error("databricks CLI not found in PATH")
+            raise ValueError(
+                "databricks CLI not found. Please install it: pip install databricks-cli"
+            )
+
+        with _token_lock:
+            _token_cache[profile] = (token, _expiry_to_monotonic(token_data.get('expiry')))
+        return token
+
+
+def _token_from_sdk(profile: str) -> str:
+    """Get an access token for a profile in-process via the SDK's unified auth.
+
+    The profile's Config is built once and reused, so its credentials
+    provider serves the cached token until it needs refreshing instead of
+    re-running the CLI or OAuth flow per call.
+    """
+    config = _sdk_configs.get(profile)
+    fresh = config is None
+    if fresh:
+        config = Config(profile=profile)
+    auth_header = config.authenticate().get("Authorization", "")
+    if not auth_header.startswith("Bearer "):
+        raise ValueError("Failed to get valid authentication token")
+    if fresh:
+        # Only stored once it has authenticated, so a failed profile is
+        # retried from scratch next time
+        _sdk_configs.setdefault(profile, config)
+    return auth_header[7:]  # Remove "Bearer " prefix
+
+
+def get_profile_token(profile: str) -> str:
+    """Get an access token for a profile.
+
+    Uses the SDK in-process first, falling back to the databricks CLI
+    subprocess only when the SDK cannot authenticate the profile.
+    """
+    try:
+        return run_profile_auth(profile, lambda: _token_from_sdk(profile))
+    except Exception as e:
+        logger.warning(
+            f"SDK authentication failed for profile '{profile}', "
+            f"falling back to databricks CLI: {e}"
+        )
+        return get_token_from_cli(profile)
 
 
 # Helper function to get a Databricks SQL connection
-def get_databricks_connection() -> Connection:
+def get_databricks_connection() -> "Connection":
     """Create and return a Databricks SQL connection using active environment.
     
     Supports both token-based and profile-based authentication:
     - Token-based: Uses access_token parameter
     - Profile-based: Uses Databricks SDK's unified auth (reads from ~/.databrickscfg)
     """
+    # Imported on first use: the SQL connector adds noticeably to server startup
+    from databricks.sql import connect
+
+    env_name = None
     try:
-        credentials = get_env_manager().get_active_credentials()
+        env_name, credentials = _active_snapshot()
 
         if not credentials:
             raise ValueError("No active environment configured")
@@ -73,49 +433,22 @@ def get_databricks_connection() -> Connection:
         # Profile-based authentication
         if 'profile' in credentials:
             logger.info(f"Connecting to SQL warehouse using profile: {credentials['profile']}")
-            # For profile-based auth, we need to get the access token from the SDK
-            # The SQL connector doesn't directly support profiles, so we extract the token
-            import json
-            import subprocess
-            
-            # Use databricks CLI to get the token
-            # The CLI auth returns a JSON object with access_token, token_type, expiry, etc.
+            # The SQL connector doesn't directly support profiles, so we extract the
+            # token, reusing the cached WorkspaceClient's auth like REST calls do
+            token = _current_bearer(credentials)
+
             try:
-                result = subprocess.run(
-                    ['databricks', 'auth', 'token', '--profile', credentials['profile']],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                    check=True
-                )
-                
-                # Parse the JSON response
-                token_data = json.loads(result.stdout)
-                token = token_data['access_token']
-                logger.info(f"Successfully obtained token from CLI (expires: {token_data.get('expiry', 'N/A')})")
-                
-            except subprocess.CalledProcessError as e:
-                logger.error(f"Failed to get token from databricks CLI: {e.stderr}")
-                raise ValueError(
-                    f"Failed to authenticate using profile '{credentials['profile']}'. "
-                    f"Ensure 'databricks' CLI is installed and configured."
-                )
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse token from CLI output: {e}")
-                raise ValueError(
-                    f"Invalid token format from databricks CLI for profile '{credentials['profile']}'"
+                return connect(
+                    server_hostname=credentials['host'],
+                    http_path=credentials['http_path'],
+                    access_token=token
                 )
-            except FileNotFoundError:
-                logger.error("databricks CLI not found in PATH")
-                raise ValueError(
-                    "databricks CLI not found. Please install it: pip install databricks-cli"
-                )
-            
-            return connect(
-                server_hostname=credentials['host'],
-                http_path=credentials['http_path'],
-                access_token=token
-            )
+            except Exception as e:
+                # Fetch a fresh token next time only if this one was rejected;
+                # network errors say nothing about the token
+                if _is_unauthorized(e):
+                    _evict_profile_token(credentials['profile'])
+                raise
         
         # Token-based authentication (legacy)
         else:
@@ -126,36 +459,43 @@ def get_databricks_connection() -> Connection:
                 access_token=credentials['token']
             )
     except Exception as e:
-        active_env = get_env_manager().get_active_environment_name()
         logger.error(f"Failed to connect to Databricks: {e}")
         raise ValueError(
             f"Error: Failed to connect to Databricks.\n"
-            f"Current environment: {active_env}\n"
+            f"Current environment: {env_name}\n"
             f"Details: {str(e)}\n\n"
             f"Please check your credentials or switch to a different environment."
         )
 
 
-def get_workspace_client() -> WorkspaceClient:
-    """Get or initialize WorkspaceClient with active environment credentials.
-    
-    Supports both token-based and profile-based authentication:
-    - Token-based: Explicitly provides host and token
-    - Profile-based: Uses profile name, SDK auto-detects auth from ~/.databrickscfg
+def _workspace_for(credentials: Dict[str, str]) -> WorkspaceClient:
+    """Get the cached WorkspaceClient for these credentials, building it if needed.
+
+    Takes the credentials from the caller's snapshot rather than reading the
+    manager again, so a concurrent switch can't pair one environment's host
+    with another's client.
     """
-    global w
+    global _workspace
 
-    try:
-        credentials = get_env_manager().get_active_credentials()
+    # Reuse the client while the credentials are unchanged
+    key = tuple(sorted(credentials.items()))
+    cached = _workspace
+    if cached is not None and cached[0] == key:
+        return cached[1]
 
-        if not credentials:
-            raise ValueError("No active environment configured")
+    with _ws_lock:
+        cached = _workspace
+        if cached is not None and cached[0] == key:
+            return cached[1]
 
         # Profile-based authentication
         if 'profile' in credentials:
             logger.info(f"Initializing WorkspaceClient using profile: {credentials['profile']}")
-            w = WorkspaceClient(profile=credentials['profile'])
-        
+            w = run_profile_auth(
+                credentials['profile'],
+                lambda: WorkspaceClient(profile=credentials['profile'])
+            )
+
         # Token-based authentication (legacy)
         else:
             logger.info("Initializing WorkspaceClient using token authentication")
@@ -163,75 +503,185 @@ def get_workspace_client() -> WorkspaceClient:
                 host=f"https://{credentials['host']}",
                 token=credentials['token']
             )
-        
-        return w
+
+        _workspace = (key, w)
+    return w
+
+
+def get_workspace_client() -> WorkspaceClient:
+    """Get or initialize WorkspaceClient with active environment credentials.
+    
+    Supports both token-based and profile-based authentication:
+    - Token-based: Explicitly provides host and token
+    - Profile-based: Uses profile name, SDK auto-detects auth from ~/.databrickscfg
+    """
+    env_name = None
+    try:
+        env_name, credentials = _active_snapshot()
+
+        if not credentials:
+            raise ValueError("No active environment configured")
+
+        return _workspace_for(credentials)
     except Exception as e:
-        active_env = get_env_manager().get_active_environment_name()
         logger.error(f"Failed to initialize WorkspaceClient: {e}")
         raise ValueError(
             f"Error: Failed to initialize Databricks WorkspaceClient.\n"
-            f"Current environment: {active_env}\n"
+            f"Current environment: {env_name}\n"
             f"Details: {str(e)}"
         )
 
 
 # Helper function for Databricks REST API requests
+def _current_bearer(credentials: Dict[str, str]) -> str:
+    """Get the access token for REST and SQL calls in the active environment.
+
+    Profile-based environments reuse the cached WorkspaceClient's auth, which
+    the SDK refreshes only when it expires. The client is looked up from the
+    given credentials, not the manager, so the token always belongs to the
+    same snapshot as the host. If that client can't be built, falls back to
+    get_profile_token. Token-based environments use the token.
+    """
+    if 'profile' not in credentials:
+        return credentials['token']
+
+    try:
+        auth_header = _workspace_for(credentials).config.authenticate().get("Authorization", "")
+        if auth_header.startswith("Bearer "):
+            return auth_header[7:]  # Remove "Bearer " prefix
+    except Exception as e:
+        logger.warning(f"WorkspaceClient auth unavailable, fetching token directly: {e}")
+
+    logger.info(f"Getting token from profile: {credentials['profile']}")
+    return get_profile_token(credentials['profile'])
+
+
 def databricks_api_request(endpoint: str, method: str = "GET", data: Dict = None) -> Dict:
     """Make a request to the Databricks REST API using active environment credentials.
     
     For profile-based authentication, retrieves the token from the SDK's auth provider.
     For token-based authentication, uses the provided token directly.
     """
+    env_name = None
     try:
-        credentials = get_env_manager().get_active_credentials()
+        env_name, credentials = _active_snapshot()
 
         if not credentials:
             raise ValueError("No active environment configured")
 
-        # Get the access token based on authentication method
-        if 'profile' in credentials:
-            # Profile-based: Get token from SDK's unified auth
-            logger.info(f"Getting token from profile: {credentials['profile']}")
-            from databricks.sdk.core import Config
-            cfg = Config(profile=credentials['profile'])
-            # Get the authentication headers using the credentials provider
-            auth_headers = cfg.authenticate()("GET", f"https://{credentials['host']}/api/2.0/{endpoint}")
-            # Extract the token from Authorization header
-            auth_header = auth_headers.get("Authorization", "")
-            if auth_header.startswith("Bearer "):
-                token = auth_header[7:]  # Remove "Bearer " prefix
-            else:
-                raise ValueError("Failed to get valid authentication token")
-        else:
-            # Token-based: Use provided token
-            token = credentials['token']
+        token = _current_bearer(credentials)
 
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
+        headers = {**_API_HEADERS, "Authorization": f"Bearer {token}"}
 
-        url = f"https://{credentials['host']}/api/2.0/{endpoint}"
+        host = credentials['host']
+        base_url = _base_url_cache.get(host)
+        if base_url is None:
+            base_url = _base_url_cache.setdefault(host, f"https://{host}/api/2.0/")
+        url = base_url + endpoint
 
         if method.upper() == "GET":
-            response = requests.get(url, headers=headers)
+            response = _http.get(url, headers=headers, params=data)
         elif method.upper() == "POST":
-            response = requests.post(url, headers=headers, json=data)
+            response = _http.post(url, headers=headers, json=data)
         else:
             raise ValueError(f"Unsupported HTTP method: {method}")
 
+        if response.status_code == _HTTP_UNAUTHORIZED and 'profile' in credentials:
+            # Don't keep serving a token the workspace rejected
+            _evict_profile_token(credentials['profile'])
         response.raise_for_status()
         return response.json()
     except Exception as e:
-        active_env = get_env_manager().get_active_environment_name()
         logger.error(f"Databricks API request failed: {e}")
         raise ValueError(
             f"Error: Failed to connect to Databricks API.\n"
-            f"Current environment: {active_env}\n"
+            f"Current environment: {env_name}\n"
             f"Details: {str(e)}"
         )
 
 
+def _ttl_cache(seconds: float) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Cache a function's results per active workspace for a fixed time.
+
+    Only successful calls are cached; exceptions propagate and are retried
+    on the next call. Entries live in _job_cache, which holds at most
+    _JOB_CACHE_MAX of them and drops expired and least recently used ones
+    first; _invalidate_job_cache() drops them all. Keys include the
+    workspace host, so a reload that repoints an environment doesn't serve
+    the old workspace's results.
+
+    Args:
+        seconds: How long a cached result stays valid
+
+    Returns:
+        Decorator for functions taking hashable positional arguments
+    """
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def wrapper(*args):
+            env_name, credentials = _active_snapshot()
+            key = (func.__name__, env_name, credentials.get('host'), *args)
+            now = time.monotonic()
+            with _job_cache_lock:
+                entry = _job_cache.get(key)
+                if entry is not None:
+                    if entry[0] > now:
+                        _job_cache.move_to_end(key)
+                        return entry[1]
+                    del _job_cache[key]
+
+            value = func(*args)
+            with _job_cache_lock:
+                _job_cache[key] = (now + seconds, value)
+                _job_cache.move_to_end(key)
+                if len(_job_cache) > _JOB_CACHE_MAX:
+                    # Expired entries go first, then the least recently used
+                    for stale in [k for k, (expiry, _) in _job_cache.items() if expiry <= now]:
+                        del _job_cache[stale]
+                    while len(_job_cache) > _JOB_CACHE_MAX:
+                        _job_cache.popitem(last=False)
+            return value
+        return wrapper
+    return decorator
+
+
+def _invalidate_job_cache() -> None:
+    """Drop all cached job metadata and run lists."""
+    with _job_cache_lock:
+        _job_cache.clear()
+
+
+@_ttl_cache(300)
+def _fetch_job(job_id: int) -> Dict:
+    """Fetch a job's settings; these only change when the job is edited."""
+    return databricks_api_request(f"jobs/get?job_id={job_id}", method="GET")
+
+
+@_ttl_cache(15)
+def _fetch_job_runs(job_id: int) -> Dict:
+    """Fetch a job's recent runs, cached briefly since runs change state."""
+    return databricks_api_request("jobs/runs/list", data={"job_id": job_id})
+
+
+def _format_epoch_ms(ms: int) -> str:
+    """Format a Jobs API epoch-milliseconds timestamp as local time, or "N/A" if unset."""
+    return datetime.fromtimestamp(ms * 0.001).strftime(_TIME_FMT) if ms else "N/A"
+
+
+# Settings shared by every cluster created through this server
+_CLUSTER_TEMPLATE: Dict[str, Any] = {
+    "data_security_mode": DataSecurityMode.DATA_SECURITY_MODE_AUTO,
+    "kind": Kind.CLASSIC_PREVIEW,
+    "spark_conf": {
+        "spark.speculation": "true"
+    },
+    "custom_tags": {
+        "Project": "mcp-databricks-server"
+    }
+}
+
+
 # Helper function to generate cluster configuration
 def get_cluster_config(
     cluster_name: str,
@@ -245,30 +695,26 @@ def get_cluster_config(
     is_single_node: bool = False
 ) -> Dict[str, Any]:
     """Generate cluster configuration with validation."""
-    if not all([cluster_name, spark_version, node_type, user_email]):
+    if not (cluster_name and spark_version and node_type and user_email):
         raise ValueError("Missing required configuration parameters")
 
     return {
+        **_CLUSTER_TEMPLATE,
         "cluster_name": cluster_name,
         "spark_version": spark_version,
         "node_type_id": node_type,
         "driver_node_type_id": node_type,
         "autotermination_minutes": autotermination_minutes,
         "single_user_name": user_email,
-        "data_security_mode": DataSecurityMode.DATA_SECURITY_MODE_AUTO,
         "use_ml_runtime": use_ml_runtime,
         "is_single_node": is_single_node,
-        "kind": Kind.CLASSIC_PREVIEW,
         "autoscale": AutoScale(
             min_workers=min_workers,
             max_workers=max_workers
         ),
-        "spark_conf": {
-            "spark.speculation": "true"
-        },
-        "custom_tags": {
-            "Project": "mcp-databricks-server"
-        }
+        # Copied so callers can't modify the shared template
+        "spark_conf": dict(_CLUSTER_TEMPLATE["spark_conf"]),
+        "custom_tags": dict(_CLUSTER_TEMPLATE["custom_tags"])
     }
 
 
@@ -287,6 +733,7 @@ def mcp_switch_environment(name: str) -> str:
     Returns:
         Success message with environment details
     """
+    _invalidate_job_cache()
     return switch_environment(name)
 
 
@@ -309,50 +756,67 @@ def mcp_get_current_environment() -> str:
 def get_schema() -> str:
     """Provide the list of tables in the Databricks SQL warehouse as a resource"""
     try:
-        conn = get_databricks_connection()
-        cursor = conn.cursor()
-        tables = cursor.tables().fetchall()
-
-        table_info = []
-        for table in tables:
-            table_info.append(f"Database: {table.TABLE_CAT}, Schema: {table.TABLE_SCHEM}, Table: {table.TABLE_NAME}")
-
-        conn.close()
-        return "\n".join(table_info)
+        env_name = get_env_manager().get_active_environment_name()
+        now = time.monotonic()
+        cached = _schema_cache.get(env_name)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        # Context managers close the cursor and warehouse session even on error
+        with get_databricks_connection() as conn, conn.cursor() as cursor:
+            tables = cursor.tables().fetchall()
+
+        schema = "\n".join(
+            f"Database: {table.TABLE_CAT}, Schema: {table.TABLE_SCHEM}, Table: {table.TABLE_NAME}"
+            for table in tables
+        )
+        _schema_cache[env_name] = (now + _SCHEMA_TTL, schema)
+        return schema
     except Exception as e:
         return f"Error retrieving tables: {str(e)}"
 
 
+@mcp.tool()
+def refresh_schema_cache() -> str:
+    """Clear cached table listings so the next schema read queries the warehouse (e.g. after DDL)"""
+    _schema_cache.clear()
+    return "Schema cache cleared."
+
+
 @mcp.tool()
 def run_sql_query(sql: str) -> str:
     """Execute SQL queries on Databricks SQL warehouse"""
     try:
-        conn = get_databricks_connection()
-        cursor = conn.cursor()
-        result = cursor.execute(sql)
+        # Context managers close the cursor and warehouse session even on error
+        with get_databricks_connection() as conn, conn.cursor() as cursor:
+            cursor.arraysize = _SQL_FETCH_SIZE
+            result = cursor.execute(sql)
 
-        if result.description:
-            # Get column names
-            columns = [col[0] for col in result.description]
-
-            # Format the result as a table
-            rows = result.fetchall()
-            if not rows:
-                conn.close()
+            if not result.description:
                 return "Query executed successfully. No results returned."
 
-            # Format as markdown table
-            table = "| " + " | ".join(columns) + " |\n"
-            table += "| " + " | ".join(["---" for _ in columns]) + " |\n"
+            # Get column names
+            columns = [col[0] for col in result.description]
 
-            for row in rows:
-                table += "| " + " | ".join([str(cell) for cell in row]) + " |\n"
+            # Format as markdown table, fetching one batch at a time so only
+            # a single chunk of rows is held in memory
+            fmt, join = _ROW_FMT.format, _SEP.join
+            parts = [fmt(join(columns)), fmt(join(["---"] * len(columns)))]
+            total = 0
+            while total < _SQL_MAX_ROWS:
+                batch = result.fetchmany(min(_SQL_FETCH_SIZE, _SQL_MAX_ROWS - total))
+                if not batch:
+                    break
+                parts.extend(fmt(join(map(str, row))) for row in batch)
+                total += len(batch)
+            else:
+                # Cap reached: only report truncation if the server has more rows
+                if result.fetchmany(1):
+                    parts.append(f"| … truncated at {_SQL_MAX_ROWS} rows |\n")
 
-            conn.close()
-            return table
-        else:
-            conn.close()
+        if not total:
             return "Query executed successfully. No results returned."
+        return "".join(parts)
     except Exception as e:
         return f"Error executing query: {str(e)}"
 
@@ -369,17 +833,22 @@ def list_jobs() -> str:
         jobs = response.get("jobs", [])
 
         # Format as markdown table
-        table = "| Job ID | Job Name | Created By |\n"
-        table += "| ------ | -------- | ---------- |\n"
+        parts = [
+            "| Job ID | Job Name | Created By |\n",
+            "| ------ | -------- | ---------- |\n",
+        ]
 
-        for job in jobs:
+        for job in itertools.islice(jobs, _LIST_MAX_ROWS):
             job_id = job.get("job_id", "N/A")
             job_name = job.get("settings", {}).get("name", "N/A")
             created_by = job.get("created_by", "N/A")
 
-            table += f"| {job_id} | {job_name} | {created_by} |\n"
+            parts.append(f"| {job_id} | {job_name} | {created_by} |\n")
+
+        if len(jobs) > _LIST_MAX_ROWS:
+            parts.append(f"\n… and {len(jobs) - _LIST_MAX_ROWS} more\n")
 
-        return table
+        return "".join(parts)
     except Exception as e:
         return f"Error listing jobs: {str(e)}"
 
@@ -388,7 +857,7 @@ def list_jobs() -> str:
 def get_job_status(job_id: int) -> str:
     """Get the status of a specific Databricks job"""
     try:
-        response = databricks_api_request("jobs/runs/list", data={"job_id": job_id})
+        response = _fetch_job_runs(job_id)
 
         if not response.get("runs"):
             return f"No runs found for job ID {job_id}."
@@ -396,8 +865,10 @@ def get_job_status(job_id: int) -> str:
         runs = response.get("runs", [])
 
         # Format as markdown table
-        table = "| Run ID | State | Start Time | End Time | Duration |\n"
-        table += "| ------ | ----- | ---------- | -------- | -------- |\n"
+        parts = [
+            "| Run ID | State | Start Time | End Time | Duration |\n",
+            "| ------ | ----- | ---------- | -------- | -------- |\n",
+        ]
 
         for run in runs:
             run_id = run.get("run_id", "N/A")
@@ -413,52 +884,78 @@ def get_job_status(job_id: int) -> str:
                 duration = "N/A"
 
             # Format timestamps
-            import datetime
-            start_time_str = datetime.datetime.fromtimestamp(start_time / 1000).strftime('%Y-%m-%d %H:%M:%S') if start_time else "N/A"
-            end_time_str = datetime.datetime.fromtimestamp(end_time / 1000).strftime('%Y-%m-%d %H:%M:%S') if end_time else "N/A"
+            start_time_str = _format_epoch_ms(start_time)
+            end_time_str = _format_epoch_ms(end_time)
 
-            table += f"| {run_id} | {state} | {start_time_str} | {end_time_str} | {duration} |\n"
+            parts.append(f"| {run_id} | {state} | {start_time_str} | {end_time_str} | {duration} |\n")
 
-        return table
+        return "".join(parts)
     except Exception as e:
         return f"Error getting job status: {str(e)}"
 
 
-@mcp.tool()
-def get_job_details(job_id: int) -> str:
-    """Get detailed information about a specific Databricks job"""
-    try:
-        response = databricks_api_request(f"jobs/get?job_id={job_id}", method="GET")
-
-        # Format the job details
-        job_name = response.get("settings", {}).get("name", "N/A")
-        created_time = response.get("created_time", 0)
+def _format_job_details(job_id: int, response: Dict) -> str:
+    """Render a jobs/get response as markdown."""
+    # Format the job details
+    job_name = response.get("settings", {}).get("name", "N/A")
+    created_time = response.get("created_time", 0)
+
+    # Convert timestamp to readable format
+    created_time_str = _format_epoch_ms(created_time)
+
+    # Get job tasks
+    tasks = response.get("settings", {}).get("tasks", [])
+
+    parts = [
+        f"## Job Details: {job_name}\n\n",
+        f"- **Job ID:** {job_id}\n",
+        f"- **Created:** {created_time_str}\n",
+        f"- **Creator:** {response.get('creator_user_name', 'N/A')}\n\n",
+    ]
+
+    if tasks:
+        parts.append("### Tasks:\n\n")
+        parts.append("| Task Key | Task Type | Description |\n")
+        parts.append("| -------- | --------- | ----------- |\n")
+
+        for task in tasks:
+            task_key = task.get("task_key", "N/A")
+            # Known task kinds are a hash lookup; unknown ones fall back to the suffix scan
+            kinds = task.keys() & _TASK_KINDS
+            task_type = (
+                next(iter(kinds)) if kinds
+                else next((k for k in task if k.endswith("_task")), "N/A")
+            )
+            description = task.get("description", "N/A")
 
-        # Convert timestamp to readable format
-        import datetime
-        created_time_str = datetime.datetime.fromtimestamp(created_time / 1000).strftime('%Y-%m-%d %H:%M:%S') if created_time else "N/A"
+            parts.append(f"| {task_key} | {task_type} | {description} |\n")
 
-        # Get job tasks
-        tasks = response.get("settings", {}).get("tasks", [])
+    return "".join(parts)
 
-        result = f"## Job Details: {job_name}\n\n"
-        result += f"- **Job ID:** {job_id}\n"
-        result += f"- **Created:** {created_time_str}\n"
-        result += f"- **Creator:** {response.get('creator_user_name', 'N/A')}\n\n"
 
-        if tasks:
-            result += "### Tasks:\n\n"
-            result += "| Task Key | Task Type | Description |\n"
-            result += "| -------- | --------- | ----------- |\n"
+@mcp.tool()
+def get_job_details(job_id: int) -> str:
+    """Get detailed information about a specific Databricks job"""
+    try:
+        return _format_job_details(job_id, _fetch_job(job_id))
+    except Exception as e:
+        return f"Error getting job details: {str(e)}"
 
-            for task in tasks:
-                task_key = task.get("task_key", "N/A")
-                task_type = next(iter([k for k in task.keys() if k.endswith("_task")]), "N/A")
-                description = task.get("description", "N/A")
 
-                result += f"| {task_key} | {task_type} | {description} |\n"
+@mcp.tool()
+def get_jobs_details(job_ids: List[int]) -> str:
+    """Get detailed information about several Databricks jobs at once"""
+    try:
+        # Fetched concurrently through the same TTL cache as get_job_details
+        futures = [_api_executor.submit(_fetch_job, job_id) for job_id in job_ids]
 
-        return result
+        sections = []
+        for job_id, future in zip(job_ids, futures):
+            try:
+                sections.append(_format_job_details(job_id, future.result()))
+            except Exception as e:
+                sections.append(f"## Job {job_id}\n\nError getting job details: {str(e)}\n")
+        return "\n".join(sections)
     except Exception as e:
         return f"Error getting job details: {str(e)}"
 
@@ -531,16 +1028,16 @@ def list_clusters() -> str:
     """List all Databricks clusters"""
     try:
         w = get_workspace_client()
-        clusters = w.clusters.list()
-
-        if not clusters:
-            return "No clusters found."
+        # The SDK pages through clusters lazily; consume only up to the cap
+        clusters = iter(w.clusters.list())
 
         # Format as markdown table
-        table = "| Cluster ID | Cluster Name | State | Spark Version | Node Type | Workers |\n"
-        table += "| ---------- | ------------ | ----- | ------------- | --------- | ------- |\n"
+        parts = [
+            "| Cluster ID | Cluster Name | State | Spark Version | Node Type | Workers |\n",
+            "| ---------- | ------------ | ----- | ------------- | --------- | ------- |\n",
+        ]
 
-        for cluster in clusters:
+        for cluster in itertools.islice(clusters, _LIST_MAX_ROWS):
             cluster_id = cluster.cluster_id or "N/A"
             cluster_name = cluster.cluster_name or "N/A"
             state = cluster.state.value if cluster.state else "N/A"
@@ -548,9 +1045,17 @@ def list_clusters() -> str:
             node_type = cluster.node_type_id or "N/A"
             workers = f"{cluster.num_workers}" if cluster.num_workers else "N/A"
 
-            table += f"| {cluster_id} | {cluster_name} | {state} | {spark_version} | {node_type} | {workers} |\n"
+            parts.append(f"| {cluster_id} | {cluster_name} | {state} | {spark_version} | {node_type} | {workers} |\n")
+
+        if len(parts) == 2:
+            return "No clusters found."
+
+        # Peek for one more instead of counting the rest, which would page
+        # through every remaining cluster in the workspace
+        if next(clusters, None) is not None:
+            parts.append(f"\n… more clusters available (showing first {_LIST_MAX_ROWS})\n")
 
-        return table
+        return "".join(parts)
     except Exception as e:
         logger.error(f"Failed to list clusters: {e}")
         return f"Error listing clusters: {str(e)}"
@@ -584,6 +1089,7 @@ def get_cluster_status(cluster_id: str) -> str:
 
 
 if __name__ == "__main__":
+    configure_logging()
     try:
         logger.info("Starting MCP server...")
         mcp.run()
@@ -2,15 +2,24 @@
 Data models for multi-environment configuration.
 
 This module defines Pydantic models for managing multiple Databricks environment
-configurations, including validation rules and helper methods.
+configurations, including validation rules and helper methods, plus a
+lightweight record of the currently active environment.
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 import re
+import time
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+# Allowed characters for environment names, profile names, and tags (use fullmatch)
+_IDENT_RE = re.compile(r'[a-zA-Z0-9_-]+')
+# Tags use the same characters, limited to 30 of them
+_TAG_RE = re.compile(r'[a-zA-Z0-9_-]{1,30}')
+
 
 class EnvironmentConfig(BaseModel):
     """Configuration for a single Databricks environment.
@@ -37,7 +46,7 @@ class EnvironmentConfig(BaseModel):
     @classmethod
     def validate_name(cls, v):
         """Validate environment name contains only allowed characters."""
-        if not re.match(r'^[a-zA-Z0-9_-]+$', v):
+        if not _IDENT_RE.fullmatch(v):
             raise ValueError(
                 'Name must contain only alphanumeric characters, hyphens, and underscores'
             )
@@ -47,7 +56,8 @@ class EnvironmentConfig(BaseModel):
     @classmethod
     def validate_host(cls, v):
         """Validate host doesn't include protocol prefix."""
-        if v.startswith('http://') or v.startswith('https://'):
+        # Any scheme separator means a URL was given where a bare hostname belongs
+        if '://' in v:
             raise ValueError('Host should not include protocol (http:// or https://)')
         return v
 
@@ -63,7 +73,7 @@ class EnvironmentConfig(BaseModel):
     @classmethod
     def validate_profile(cls, v):
         """Validate profile name contains only allowed characters."""
-        if v is not None and not re.match(r'^[a-zA-Z0-9_-]+$', v):
+        if v is not None and not _IDENT_RE.fullmatch(v):
             raise ValueError(
                 'Profile name must contain only alphanumeric characters, hyphens, and underscores'
             )
@@ -72,19 +82,18 @@ class EnvironmentConfig(BaseModel):
     @model_validator(mode='after')
     def validate_auth_method(self):
         """Ensure exactly one authentication method is specified."""
-        has_token = self.token is not None
-        has_profile = self.profile is not None
-        
-        if not has_token and not has_profile:
+        # Valid configs pass with a single comparison; only errors need to know which case
+        if (self.token is None) != (self.profile is None):
+            return self
+
+        if self.token is None:
             raise ValueError(
                 f"Environment '{self.name}': Either 'token' or 'profile' must be specified"
             )
-        if has_token and has_profile:
-            raise ValueError(
-                f"Environment '{self.name}': Cannot specify both 'token' and 'profile'. "
-                "Choose one authentication method."
-            )
-        return self
+        raise ValueError(
+            f"Environment '{self.name}': Cannot specify both 'token' and 'profile'. "
+            "Choose one authentication method."
+        )
 
     @field_validator('tags')
     @classmethod
@@ -93,13 +102,16 @@ class EnvironmentConfig(BaseModel):
         if v is None:
             return []
         for tag in v:
-            if len(tag) > 30:
-                raise ValueError(f'Tag "{tag}" exceeds 30 character limit')
-            if not re.match(r'^[a-zA-Z0-9_-]+$', tag):
+            # One match checks both length and characters; only failures need to know which
+            if not _TAG_RE.fullmatch(tag):
+                if len(tag) > 30:
+                    raise ValueError(f'Tag "{tag}" exceeds 30 character limit')
                 raise ValueError(f'Tag "{tag}" contains invalid characters')
         return v
 
     model_config = {
+        # Validated once at load and shared across managers, so never mutated
+        'frozen': True,
         # Don't expose token in string representation
         'json_schema_extra': {
             'examples': [{
@@ -112,8 +124,26 @@ class EnvironmentConfig(BaseModel):
     }
 
 
+def build_credentials(config: EnvironmentConfig) -> Mapping[str, str]:
+    """Build the read-only connection credentials for an environment.
+
+    Holds host and http_path plus either token or profile, whichever
+    authentication method the environment uses.
+    """
+    credentials = {'host': config.host, 'http_path': config.http_path}
+    if config.token:
+        credentials['token'] = config.token
+    elif config.profile:
+        credentials['profile'] = config.profile
+    return MappingProxyType(credentials)
+
+
 class EnvironmentsConfiguration(BaseModel):
-    """Container for all environment configurations."""
+    """Container for all environment configurations.
+
+    The environments dict must be keyed by each environment's name. The
+    loaders build it that way, so the invariant isn't re-checked here.
+    """
 
     default: str = Field(..., description="Default environment name")
     environments: Dict[str, EnvironmentConfig] = Field(..., min_items=1)
@@ -129,16 +159,13 @@ class EnvironmentsConfiguration(BaseModel):
             )
         return self
 
-    @field_validator('environments')
-    @classmethod
-    def validate_environment_names_match_keys(cls, v):
-        """Ensure environment names match their dictionary keys."""
-        for key, env in v.items():
-            if env.name != key:
-                raise ValueError(
-                    f'Environment key "{key}" does not match environment name "{env.name}"'
-                )
-        return v
+    def __getitem__(self, name: str) -> EnvironmentConfig:
+        """Get an environment by name, raising KeyError if it doesn't exist."""
+        return self.environments[name]
+
+    def __contains__(self, name: str) -> bool:
+        """Check whether an environment with this name is configured."""
+        return name in self.environments
 
     def get_default_environment(self) -> EnvironmentConfig:
         """Get the default environment configuration."""
@@ -153,12 +180,29 @@ class EnvironmentsConfiguration(BaseModel):
         return list(self.environments.keys())
 
 
-class ActiveEnvironment(BaseModel):
-    """Represents the currently active environment."""
+@dataclass(frozen=True, slots=True)
+class ActiveEnvironment:
+    """Represents the currently active environment.
+
+    A plain slotted dataclass: its config was already validated when the
+    configuration was loaded, so activation does no further validation.
+    """
 
     name: str
     config: EnvironmentConfig
-    activated_at: datetime = Field(default_factory=datetime.now)
+    # Raw epoch nanoseconds; the datetime is only built when someone asks for it
+    activated_ns: int = field(default_factory=time.time_ns)
+    # Built once from config unless the caller already has it
+    credentials: Optional[Mapping[str, str]] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.credentials is None:
+            object.__setattr__(self, 'credentials', build_credentials(self.config))
+
+    @property
+    def activated_at(self) -> datetime:
+        """Get the activation time as a local datetime."""
+        return datetime.fromtimestamp(self.activated_ns / 1e9)
 
     def get_credentials(self) -> Dict[str, str]:
         """Get credentials for Databricks connection.
@@ -166,18 +210,11 @@ class ActiveEnvironment(BaseModel):
         Returns a dictionary containing connection details with either:
         - token-based auth: host, token, http_path
         - profile-based auth: host, profile, http_path
+
+        Each call returns a fresh copy, so callers can't alter the shared
+        credentials.
         """
-        credentials = {
-            'host': self.config.host,
-            'http_path': self.config.http_path
-        }
-        
-        if self.config.token:
-            credentials['token'] = self.config.token
-        elif self.config.profile:
-            credentials['profile'] = self.config.profile
-            
-        return credentials
+        return dict(self.credentials)
 
     def to_summary(self) -> str:
         """Get a summary string for logging."""
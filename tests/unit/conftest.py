@@ -0,0 +1,20 @@
+"""
+Shared setup for the unit tests.
+
+Puts the project root on the import path and configures logging once for
+the whole session, rather than in each test module.
+"""
+
+import logging
+import os
+import sys
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Configure logging to stderr
+logging.basicConfig(
+    level=logging.INFO,
+    stream=sys.stderr,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
@@ -9,27 +9,95 @@ It attempts to connect to both the SQL warehouse and the Databricks API.
 import os
 import unittest
 from unittest.mock import patch, MagicMock
+
+import pytest
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Read once so skip decisions and setUp always see the same values
+_HOST = os.getenv("DATABRICKS_HOST")
+_TOKEN = os.getenv("DATABRICKS_TOKEN")
+_HTTP_PATH = os.getenv("DATABRICKS_HTTP_PATH")
+_HAVE_API = all((_HOST, _TOKEN))
+_HAVE_SQL = all((_HOST, _TOKEN, _HTTP_PATH))
+
 
 class TestDatabricksConnection(unittest.TestCase):
     """Test cases for Databricks connection functionality."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Open one API session and SQL warehouse connection for the whole class, if configured."""
+        cls._session = None
+        cls._sql_conn = None
+        cls._sql_conn_error = None
+        
+        if _HAVE_API:
+            try:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+            except ImportError:
+                pass
+            else:
+                # One pooled session so repeated API calls reuse the TLS connection
+                cls._session = requests.Session()
+                cls._session.mount('https://', HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=8,
+                    max_retries=Retry(
+                        total=2,
+                        backoff_factor=0.2,
+                        status_forcelist=[429, 500, 502, 503, 504]
+                    )
+                ))
+                cls._session.headers.update({
+                    "Authorization": f"Bearer {_TOKEN}",
+                    "Content-Type": "application/json"
+                })
+        
+        if not _HAVE_SQL:
+            return
+        
+        try:
+            from databricks.sql import connect
+        except ImportError:
+            return
+        
+        try:
+            cls._sql_conn = connect(
+                server_hostname=_HOST,
+                http_path=_HTTP_PATH,
+                access_token=_TOKEN
+            )
+        except Exception as e:
+            # Reported by the SQL test rather than failing every test in the class
+            cls._sql_conn_error = e
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Close the shared HTTP session and SQL warehouse connection."""
+        if cls._session:
+            cls._session.close()
+            cls._session = None
+        if cls._sql_conn:
+            cls._sql_conn.close()
+            cls._sql_conn = None
+    
     def setUp(self):
         """Set up test fixtures before each test method."""
-        self.databricks_host = os.getenv("DATABRICKS_HOST")
-        self.databricks_token = os.getenv("DATABRICKS_TOKEN")
-        self.databricks_http_path = os.getenv("DATABRICKS_HTTP_PATH")
+        self.databricks_host = _HOST
+        self.databricks_token = _TOKEN
+        self.databricks_http_path = _HTTP_PATH
         
         # Required environment variables
-        self.required_vars = [
-            "DATABRICKS_HOST",
-            "DATABRICKS_TOKEN", 
-            "DATABRICKS_HTTP_PATH"
-        ]
+        self.required_vars = {
+            "DATABRICKS_HOST": _HOST,
+            "DATABRICKS_TOKEN": _TOKEN,
+            "DATABRICKS_HTTP_PATH": _HTTP_PATH
+        }
     
     def tearDown(self):
         """Clean up after each test method."""
@@ -38,8 +106,8 @@ class TestDatabricksConnection(unittest.TestCase):
     def test_environment_variables_present(self):
         """Test that all required environment variables are set."""
         missing = []
-        for var in self.required_vars:
-            if not os.getenv(var):
+        for var, value in self.required_vars.items():
+            if not value:
                 missing.append(var)
         
         self.assertEqual(
@@ -48,26 +116,21 @@ class TestDatabricksConnection(unittest.TestCase):
             "Please check your .env file and make sure all required variables are set."
         )
     
-    @unittest.skipIf(
-        not all(os.getenv(var) for var in ["DATABRICKS_HOST", "DATABRICKS_TOKEN"]),
+    @pytest.mark.integration
+    @unittest.skipUnless(
+        _HAVE_API,
         "Skipping API test - missing required environment variables"
     )
     def test_databricks_api_connection(self):
         """Test connection to Databricks API."""
-        try:
-            import requests
-        except ImportError:
+        if self._session is None:
             self.skipTest("requests library not available")
-        
-        headers = {
-            "Authorization": f"Bearer {self.databricks_token}",
-            "Content-Type": "application/json"
-        }
+        import requests
         
         url = f"https://{self.databricks_host}/api/2.0/clusters/list-node-types"
         
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self._session.get(url, timeout=30)
             self.assertEqual(
                 response.status_code, 200,
                 f"Failed to connect to Databricks API: {response.status_code} - {response.text}"
@@ -75,28 +138,22 @@ class TestDatabricksConnection(unittest.TestCase):
         except requests.exceptions.RequestException as e:
             self.fail(f"Error connecting to Databricks API: {str(e)}")
     
-    @unittest.skipIf(
-        not all(os.getenv(var) for var in ["DATABRICKS_HOST", "DATABRICKS_TOKEN", "DATABRICKS_HTTP_PATH"]),
+    @pytest.mark.integration
+    @unittest.skipUnless(
+        _HAVE_SQL,
         "Skipping SQL test - missing required environment variables"
     )
     def test_sql_warehouse_connection(self):
         """Test connection to Databricks SQL warehouse."""
-        try:
-            from databricks.sql import connect
-        except ImportError:
+        if self._sql_conn_error is not None:
+            self.fail(f"Error connecting to Databricks SQL warehouse: {str(self._sql_conn_error)}")
+        if self._sql_conn is None:
             self.skipTest("databricks-sql-connector library not available")
         
-        conn = None
         try:
-            conn = connect(
-                server_hostname=self.databricks_host,
-                http_path=self.databricks_http_path,
-                access_token=self.databricks_token
-            )
-            
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1 AS test")
-            result = cursor.fetchall()
+            with self._sql_conn.cursor() as cursor:
+                cursor.execute("SELECT 1 AS test")
+                result = cursor.fetchall()
             
             self.assertIsNotNone(result, "Failed to get result from SQL warehouse")
             self.assertEqual(len(result), 1, "Expected exactly one row")
@@ -104,9 +161,6 @@ class TestDatabricksConnection(unittest.TestCase):
             
         except Exception as e:
             self.fail(f"Error connecting to Databricks SQL warehouse: {str(e)}")
-        finally:
-            if conn:
-                conn.close()
     
     def test_credentials_format(self):
         """Test that credentials are in expected format."""
@@ -0,0 +1,169 @@
+"""
+Unit tests for the models.environment module.
+
+Tests cover field validation on EnvironmentConfig, lookups on
+EnvironmentsConfiguration, and the ActiveEnvironment record.
+"""
+
+import dataclasses
+
+import pytest
+from pydantic import ValidationError
+
+from models.environment import (
+    ActiveEnvironment,
+    EnvironmentConfig,
+    EnvironmentsConfiguration
+)
+
+
+def _env(**overrides) -> dict:
+    """Build valid EnvironmentConfig data with selected fields overridden."""
+    data = {
+        'name': 'dev',
+        'host': 'dev.cloud.databricks.com',
+        'token': 'dapi_dev',
+        'http_path': '/sql/1.0/warehouses/abc123',
+    }
+    data.update(overrides)
+    return data
+
+
+class TestEnvironmentConfig:
+    """Test suite for EnvironmentConfig field validation."""
+
+    def test_valid_token_environment(self):
+        """Test that a complete token-based environment validates."""
+        config = EnvironmentConfig(**_env(tags=['team-a', 'etl_1']))
+
+        assert config.token == 'dapi_dev'
+        assert config.tags == ['team-a', 'etl_1']
+
+    def test_config_is_immutable(self):
+        """Test that a loaded config can't be modified in place."""
+        config = EnvironmentConfig(**_env())
+
+        with pytest.raises(ValidationError):
+            config.host = 'other.cloud.databricks.com'
+
+    @pytest.mark.parametrize('field, value', [
+        ('name', 'dev env'),
+        ('profile', 'my.profile'),
+        ('tags', ['ok', 'not ok']),
+        ('name', 'dev\n'),
+        ('tags', ['ok\n']),
+    ])
+    def test_identifier_fields_reject_invalid_characters(self, field, value):
+        """Test that names, profiles, and tags only allow [A-Za-z0-9_-]."""
+        overrides = {field: value}
+        if field == 'profile':
+            overrides['token'] = None
+
+        with pytest.raises(ValidationError):
+            EnvironmentConfig(**_env(**overrides))
+
+    def test_tag_length_limit(self):
+        """Test that tags longer than 30 characters are rejected as too long."""
+        EnvironmentConfig(**_env(tags=['a' * 30]))
+
+        with pytest.raises(ValidationError, match="exceeds 30 character limit"):
+            EnvironmentConfig(**_env(tags=['a' * 31]))
+
+    def test_auth_method_required(self):
+        """Test that an environment without token or profile is rejected."""
+        with pytest.raises(ValidationError, match="Either 'token' or 'profile'"):
+            EnvironmentConfig(**_env(token=None))
+
+    def test_auth_methods_exclusive(self):
+        """Test that token and profile can't both be set."""
+        with pytest.raises(ValidationError, match="Cannot specify both"):
+            EnvironmentConfig(**_env(profile='dev-profile'))
+
+    @pytest.mark.parametrize('host', [
+        'http://dev.cloud.databricks.com',
+        'https://dev.cloud.databricks.com',
+        'HTTPS://dev.cloud.databricks.com',
+    ])
+    def test_host_rejects_protocol(self, host):
+        """Test that hosts must be given without a URL scheme."""
+        with pytest.raises(ValidationError, match="should not include protocol"):
+            EnvironmentConfig(**_env(host=host))
+
+    def test_http_path_must_be_warehouse_path(self):
+        """Test that http_path must point at a SQL warehouse."""
+        with pytest.raises(ValidationError):
+            EnvironmentConfig(**_env(http_path='/sql/protocolv1/o/123'))
+
+
+class TestEnvironmentsConfiguration:
+    """Test suite for EnvironmentsConfiguration lookups."""
+
+    @pytest.fixture
+    def configuration(self):
+        return EnvironmentsConfiguration(
+            default='dev',
+            environments={
+                'dev': EnvironmentConfig(**_env()),
+                'prod': EnvironmentConfig(**_env(name='prod', token='dapi_prod')),
+            }
+        )
+
+    def test_item_access_by_name(self, configuration):
+        """Test that configuration[name] returns that environment."""
+        assert configuration['prod'].token == 'dapi_prod'
+        with pytest.raises(KeyError):
+            configuration['staging']
+
+    def test_membership_by_name(self, configuration):
+        """Test that `in` checks configured environment names."""
+        assert 'dev' in configuration
+        assert 'staging' not in configuration
+
+    def test_missing_default_rejected(self):
+        """Test that the default must name a configured environment."""
+        with pytest.raises(ValidationError, match='Default environment "qa" not found'):
+            EnvironmentsConfiguration(
+                default='qa',
+                environments={'dev': EnvironmentConfig(**_env())}
+            )
+
+
+class TestActiveEnvironment:
+    """Test suite for ActiveEnvironment."""
+
+    def test_activation_time_recorded(self):
+        """Test that activated_at reflects the construction time."""
+        active = ActiveEnvironment(name='dev', config=EnvironmentConfig(**_env()))
+
+        assert active.activated_at.year >= 2024
+
+    def test_immutable_and_slotted(self):
+        """Test that fields can't be reassigned and no per-instance dict exists."""
+        active = ActiveEnvironment(name='dev', config=EnvironmentConfig(**_env()))
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            active.name = 'prod'
+        assert not hasattr(active, '__dict__')
+
+    def test_credentials_returned_as_copies(self):
+        """Test that get_credentials returns a fresh dict on every call."""
+        active = ActiveEnvironment(name='dev', config=EnvironmentConfig(**_env()))
+
+        credentials = active.get_credentials()
+
+        assert credentials == {
+            'host': 'dev.cloud.databricks.com',
+            'http_path': '/sql/1.0/warehouses/abc123',
+            'token': 'dapi_dev'
+        }
+        credentials['token'] = 'dapi_other'
+        assert active.get_credentials()['token'] == 'dapi_dev'
+
+    def test_profile_credentials(self):
+        """Test that profile environments expose profile instead of token."""
+        config = EnvironmentConfig(**_env(token=None, profile='dev-profile'))
+
+        credentials = ActiveEnvironment(name='dev', config=config).get_credentials()
+
+        assert credentials['profile'] == 'dev-profile'
+        assert 'token' not in credentials
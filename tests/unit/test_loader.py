@@ -0,0 +1,147 @@
+"""
+Unit tests for the config.loader module.
+
+Tests cover YAML loading, legacy .env fallback, and the detection logic
+in auto_load_configuration, using the files under tests/fixtures.
+"""
+
+import os
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+from config.loader import auto_load_configuration, load_from_env, load_from_yaml
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), '..', 'fixtures')
+VALID_YAML = os.path.join(FIXTURES_DIR, 'test_environments.yaml')
+INVALID_YAML = os.path.join(FIXTURES_DIR, 'test_invalid.yaml')
+LEGACY_ENV = os.path.join(FIXTURES_DIR, 'test.env')
+
+ENV_VARS = ('DATABRICKS_HOST', 'DATABRICKS_TOKEN', 'DATABRICKS_HTTP_PATH')
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    """Remove Databricks variables so .env loading starts from a clean slate."""
+    for var in ENV_VARS:
+        monkeypatch.delenv(var, raising=False)
+    yield
+    for var in ENV_VARS:
+        os.environ.pop(var, None)
+
+
+class TestLoadFromYaml:
+    """Test suite for load_from_yaml function."""
+
+    def test_loads_all_environments(self):
+        """Test that every environment in the fixture is loaded."""
+        config = load_from_yaml(VALID_YAML)
+
+        assert config.default == 'dev'
+        assert sorted(config.environments) == ['dev', 'prod', 'staging']
+        assert config.environments['prod'].host == 'prod-workspace.cloud.databricks.com'
+
+    def test_reads_whole_file_when_stat_is_stale(self, tmp_path):
+        """Test that a file which grew after the caller's stat is still read fully."""
+        yaml_file = tmp_path / 'environments.yaml'
+        yaml_file.write_text('default: dev\n')
+        stale_stat = os.stat(yaml_file)
+        shutil.copy(VALID_YAML, yaml_file)
+
+        config = load_from_yaml(str(yaml_file), _stat=stale_stat)
+
+        assert len(config.environments) == 3
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test that a missing YAML file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_from_yaml(str(tmp_path / 'missing.yaml'))
+
+    def test_invalid_environment_rejected(self, tmp_path):
+        """Test that per-environment field validation still runs on load."""
+        yaml_file = tmp_path / 'environments.yaml'
+        with open(VALID_YAML) as f:
+            yaml_file.write_text(f.read().replace('dapi_prod_token_789012', 'not_a_token'))
+
+        with pytest.raises(ValueError, match='Token should start with "dapi"'):
+            load_from_yaml(str(yaml_file))
+
+    def test_environment_name_taken_from_key(self, tmp_path):
+        """Test that each environment is named after its YAML key."""
+        yaml_file = tmp_path / 'environments.yaml'
+        yaml_file.write_text(
+            "default: dev\n"
+            "environments:\n"
+            "  dev:\n"
+            "    name: something-else\n"
+            "    host: dev.cloud.databricks.com\n"
+            "    token: dapi_dev\n"
+            "    http_path: /sql/1.0/warehouses/abc\n"
+        )
+
+        config = load_from_yaml(str(yaml_file))
+
+        assert config.environments['dev'].name == 'dev'
+
+    def test_missing_default_raises(self):
+        """Test that a configuration without a default is rejected."""
+        with pytest.raises(ValueError):
+            load_from_yaml(INVALID_YAML)
+
+
+class TestLoadFromEnv:
+    """Test suite for load_from_env function."""
+
+    def test_loads_single_default_environment(self, clean_env):
+        """Test that a legacy .env file becomes a single 'default' environment."""
+        config = load_from_env(LEGACY_ENV)
+
+        assert config.default == 'default'
+        assert config.environments['default'].host == 'legacy-workspace.cloud.databricks.com'
+
+    def test_exported_variables_skip_dotenv(self, clean_env, monkeypatch):
+        """Test that the .env file is not parsed when all variables are exported."""
+        monkeypatch.setenv('DATABRICKS_HOST', 'exported.cloud.databricks.com')
+        monkeypatch.setenv('DATABRICKS_TOKEN', 'dapi_exported')
+        monkeypatch.setenv('DATABRICKS_HTTP_PATH', '/sql/1.0/warehouses/exported')
+
+        with patch('config.loader.load_dotenv') as mock_load_dotenv:
+            config = load_from_env(LEGACY_ENV)
+
+        mock_load_dotenv.assert_not_called()
+        assert config.environments['default'].host == 'exported.cloud.databricks.com'
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test that a missing .env file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_from_env(str(tmp_path / '.env'))
+
+
+class TestAutoLoadConfiguration:
+    """Test suite for auto_load_configuration function."""
+
+    def test_prefers_yaml_when_both_exist(self, tmp_path, clean_env):
+        """Test that YAML wins over .env when both files are present."""
+        yaml_file = shutil.copy(VALID_YAML, tmp_path / 'environments.yaml')
+        env_file = shutil.copy(LEGACY_ENV, tmp_path / '.env')
+
+        config = auto_load_configuration(str(yaml_file), str(env_file))
+
+        assert config.default == 'dev'
+
+    def test_falls_back_to_env(self, tmp_path, clean_env):
+        """Test that .env is used when no YAML file exists."""
+        env_file = shutil.copy(LEGACY_ENV, tmp_path / '.env')
+
+        config = auto_load_configuration(str(tmp_path / 'environments.yaml'), str(env_file))
+
+        assert config.default == 'default'
+
+    def test_no_configuration_raises(self, tmp_path):
+        """Test that a clear error is raised when neither file exists."""
+        with pytest.raises(FileNotFoundError, match="No configuration file found"):
+            auto_load_configuration(
+                str(tmp_path / 'environments.yaml'),
+                str(tmp_path / '.env')
+            )
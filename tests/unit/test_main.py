@@ -0,0 +1,900 @@
+"""
+Unit tests for helper functions in main.py.
+
+Databricks CLI, SDK, and HTTP calls are mocked, so these tests run without
+a workspace or credentials.
+"""
+
+import json
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import main
+from config.manager import EnvironmentManager
+
+
+def _cli_result(token: str, expiry: str = None) -> MagicMock:
+    """Build a fake `databricks auth token` CompletedProcess."""
+    payload = {'access_token': token, 'token_type': 'Bearer'}
+    if expiry:
+        payload['expiry'] = expiry
+    return MagicMock(stdout=json.dumps(payload).encode())
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Start every test with empty token and job caches and a fake CLI on PATH."""
+    main._token_cache.clear()
+    main._sdk_configs.clear()
+    main._invalidate_job_cache()
+    with patch('main._resolved_databricks_cmd', '/usr/bin/databricks'):
+        yield
+    main._token_cache.clear()
+    main._sdk_configs.clear()
+    main._invalidate_job_cache()
+
+
+class TestGetTokenFromCli:
+    """Test suite for get_token_from_cli caching."""
+
+    def test_token_reused_until_expiry(self):
+        """Test that the CLI subprocess runs once for repeated calls."""
+        with patch('main.subprocess.run', return_value=_cli_result('tok-1')) as mock_run:
+            assert main.get_token_from_cli('dev') == 'tok-1'
+            assert main.get_token_from_cli('dev') == 'tok-1'
+
+        mock_run.assert_called_once()
+
+    def test_token_cached_per_profile(self):
+        """Test that different profiles get their own tokens."""
+        results = [_cli_result('tok-dev'), _cli_result('tok-prod')]
+        with patch('main.subprocess.run', side_effect=results) as mock_run:
+            assert main.get_token_from_cli('dev') == 'tok-dev'
+            assert main.get_token_from_cli('prod') == 'tok-prod'
+
+        assert mock_run.call_count == 2
+
+    def test_expired_token_refreshed(self):
+        """Test that a token expiring within the skew window is fetched again."""
+        soon = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(time.time() + 10))
+        results = [_cli_result('tok-old', soon), _cli_result('tok-new')]
+        with patch('main.subprocess.run', side_effect=results) as mock_run:
+            assert main.get_token_from_cli('dev') == 'tok-old'
+            assert main.get_token_from_cli('dev') == 'tok-new'
+
+        assert mock_run.call_count == 2
+
+    @pytest.mark.parametrize('expiry', [
+        '2030-01-02T03:04:05Z',
+        '2030-01-02T03:04:05.123456789Z',
+        '2030-01-02T04:04:05.5+01:00',
+    ])
+    def test_go_expiry_formats_parsed(self, expiry):
+        """Test that the CLI's RFC 3339 expiries parse on every supported Python."""
+        parsed = main._parse_cli_expiry(expiry)
+
+        assert parsed.replace(microsecond=0).timestamp() == 1893553445
+
+    def test_unparseable_expiry_uses_short_ttl(self):
+        """Test that an unknown expiry format isn't trusted for long."""
+        deadline = main._expiry_to_monotonic('not a timestamp')
+
+        assert deadline - time.monotonic() <= main._DEFAULT_TOKEN_TTL
+        assert main._DEFAULT_TOKEN_TTL <= 300
+
+    def test_slow_profile_does_not_block_others(self):
+        """Test that one profile's slow CLI call doesn't hold up another profile."""
+        release = threading.Event()
+
+        def fake_run(args, **kwargs):
+            if 'slow' in args:
+                release.wait(5)
+                return _cli_result('tok-slow')
+            return _cli_result('tok-fast')
+
+        with patch('main.subprocess.run', side_effect=fake_run):
+            slow = threading.Thread(target=main.get_token_from_cli, args=('slow',))
+            slow.start()
+            try:
+                time.sleep(0.05)
+                started = time.monotonic()
+                assert main.get_token_from_cli('fast') == 'tok-fast'
+                assert time.monotonic() - started < 1
+            finally:
+                release.set()
+                slow.join()
+
+    def test_concurrent_calls_for_one_profile_run_cli_once(self):
+        """Test that racing callers for the same profile share one CLI call."""
+        def fake_run(args, **kwargs):
+            time.sleep(0.05)
+            return _cli_result('tok')
+
+        with patch('main.subprocess.run', side_effect=fake_run) as mock_run:
+            threads = [threading.Thread(target=main.get_token_from_cli, args=('dev',)) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        mock_run.assert_called_once()
+
+    def test_missing_cli_raises_value_error(self):
+        """Test that a missing CLI is reported with install guidance."""
+        with patch('main._resolved_databricks_cmd', None), \
+                patch('main.shutil.which', return_value=None), \
+                patch('main.subprocess.run') as mock_run:
+            with pytest.raises(ValueError, match="databricks CLI not found"):
+                main.get_token_from_cli('dev')
+
+        mock_run.assert_not_called()
+
+    def test_cli_path_resolved_once(self):
+        """Test that PATH lookup happens only on the first call."""
+        with patch('main._resolved_databricks_cmd', None), \
+                patch('main.shutil.which', return_value='/opt/bin/databricks') as mock_which, \
+                patch('main.subprocess.run', return_value=_cli_result('tok')) as mock_run:
+            main.get_token_from_cli('dev')
+            main.get_token_from_cli('prod')
+
+        mock_which.assert_called_once_with('databricks')
+        assert mock_run.call_args.args[0][0] == '/opt/bin/databricks'
+
+
+class TestRunWithTimeout:
+    """Test suite for run_with_timeout."""
+
+    def test_returns_result(self):
+        """Test that a fast call's result is returned unchanged."""
+        assert main.run_with_timeout(lambda: 42, 1) == 42
+
+    def test_propagates_exceptions(self):
+        """Test that errors raised by the call reach the caller."""
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            main.run_with_timeout(fail, 1)
+
+    def test_times_out(self):
+        """Test that a slow call raises TimeoutError."""
+        with pytest.raises(TimeoutError, match="timed out"):
+            main.run_with_timeout(lambda: time.sleep(0.5), 0.05)
+
+    def test_hung_calls_do_not_block_later_calls(self):
+        """Test that abandoned calls don't use up capacity for later ones."""
+        release = threading.Event()
+        try:
+            for _ in range(3):
+                with pytest.raises(TimeoutError):
+                    main.run_with_timeout(release.wait, 0.05)
+
+            assert main.run_with_timeout(lambda: 42, 1) == 42
+        finally:
+            release.set()
+
+    def test_abandoned_call_runs_on_daemon_thread(self):
+        """Test that a hung call can't keep the interpreter from exiting."""
+        release = threading.Event()
+        try:
+            with pytest.raises(TimeoutError):
+                main.run_with_timeout(release.wait, 0.05)
+
+            workers = [t for t in threading.enumerate() if t.name == 'dbx-auth']
+            assert workers and all(t.daemon for t in workers)
+        finally:
+            release.set()
+
+
+class TestRunProfileAuth:
+    """Test suite for run_profile_auth and the .databrickscfg auth check."""
+
+    @pytest.fixture
+    def databrickscfg(self, tmp_path, monkeypatch):
+        """Point the SDK config file at a temporary .databrickscfg."""
+        config_file = tmp_path / '.databrickscfg'
+        config_file.write_text(
+            "[pat]\nhost = https://a.cloud.databricks.com\ntoken = dapi123\n\n"
+            "[m2m]\nhost = https://a.cloud.databricks.com\nauth_type = oauth-m2m\n\n"
+            "[u2m]\nhost = https://a.cloud.databricks.com\nauth_type = databricks-cli\n\n"
+            "[bare]\nhost = https://a.cloud.databricks.com\n"
+        )
+        monkeypatch.setenv('DATABRICKS_CONFIG_FILE', str(config_file))
+
+    @pytest.mark.parametrize('profile, expected', [
+        ('pat', True),
+        ('m2m', True),
+        ('u2m', False),
+        ('bare', False),
+        ('missing', False),
+    ])
+    def test_profile_classification(self, databrickscfg, profile, expected):
+        """Test which profiles are treated as unable to block."""
+        assert main._profile_auth_is_noninteractive(profile) is expected
+
+    def test_config_parsed_once_until_modified(self, databrickscfg, tmp_path):
+        """Test that .databrickscfg is only re-parsed after it changes."""
+        main._read_databricks_config.cache_clear()
+        with patch('main.configparser.ConfigParser', wraps=main.configparser.ConfigParser) as mock_parser:
+            assert main._profile_auth_is_noninteractive('pat') is True
+            assert main._profile_auth_is_noninteractive('u2m') is False
+            assert mock_parser.call_count == 1
+
+            config_file = tmp_path / '.databrickscfg'
+            config_file.write_text("[u2m]\nhost = https://a.cloud.databricks.com\ntoken = dapi123\n")
+            stat = config_file.stat()
+            os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            assert main._profile_auth_is_noninteractive('u2m') is True
+            assert mock_parser.call_count == 2
+
+    def test_noninteractive_runs_inline(self, databrickscfg):
+        """Test that token profiles skip the executor and timeout."""
+        with patch('main.run_with_timeout') as mock_timeout:
+            assert main.run_profile_auth('pat', lambda: 'ok') == 'ok'
+
+        mock_timeout.assert_not_called()
+
+    def test_interactive_bounded_by_timeout(self, databrickscfg):
+        """Test that profiles which may open a browser keep the timeout."""
+        with patch('main.run_with_timeout', return_value='ok') as mock_timeout:
+            assert main.run_profile_auth('u2m', lambda: 'never') == 'ok'
+
+        mock_timeout.assert_called_once()
+
+
+class TestGetProfileToken:
+    """Test suite for get_profile_token."""
+
+    def test_sdk_token_used_without_cli(self):
+        """Test that a working SDK profile never spawns the CLI."""
+        config = MagicMock()
+        config.authenticate.return_value = {'Authorization': 'Bearer sdk-token'}
+        with patch('main.Config', return_value=config), \
+                patch('main.subprocess.run') as mock_run:
+            assert main.get_profile_token('dev') == 'sdk-token'
+
+        mock_run.assert_not_called()
+
+    def test_falls_back_to_cli_when_sdk_fails(self):
+        """Test that the CLI is used when the SDK cannot authenticate."""
+        with patch('main.Config', side_effect=ValueError("no profile")), \
+                patch('main.subprocess.run', return_value=_cli_result('cli-token')):
+            assert main.get_profile_token('dev') == 'cli-token'
+
+    def test_sdk_config_reused_between_calls(self):
+        """Test that repeated calls authenticate through one Config per profile."""
+        config = MagicMock()
+        config.authenticate.return_value = {'Authorization': 'Bearer sdk-token'}
+        with patch('main.Config', return_value=config) as mock_config:
+            main.get_profile_token('dev')
+            main.get_profile_token('dev')
+
+        mock_config.assert_called_once_with(profile='dev')
+        assert config.authenticate.call_count == 2
+
+    def test_failed_sdk_config_not_cached(self):
+        """Test that a Config that fails to authenticate is rebuilt next call."""
+        broken = MagicMock()
+        broken.authenticate.side_effect = ValueError("expired")
+        working = MagicMock()
+        working.authenticate.return_value = {'Authorization': 'Bearer sdk-token'}
+        with patch('main.Config', side_effect=[broken, working]), \
+                patch('main.subprocess.run', return_value=_cli_result('cli-token')):
+            assert main.get_profile_token('dev') == 'cli-token'
+            main._token_cache.clear()
+            assert main.get_profile_token('dev') == 'sdk-token'
+
+        assert main._sdk_configs['dev'] is working
+
+    def test_sql_connection_reuses_workspace_client_auth(self):
+        """Test that profile SQL connections take the bearer from the WorkspaceClient."""
+        credentials = {
+            'host': 'dev.cloud.databricks.com',
+            'http_path': '/sql/1.0/warehouses/abc',
+            'profile': 'dev'
+        }
+        client = MagicMock()
+        client.config.authenticate.return_value = {'Authorization': 'Bearer ws-token'}
+        with patch('main._active_snapshot', return_value=('dev', credentials)), \
+                patch('main._workspace_for', return_value=client), \
+                patch('main.get_profile_token') as mock_profile_token, \
+                patch('databricks.sql.connect') as mock_connect:
+            main.get_databricks_connection()
+
+        assert mock_connect.call_args.kwargs['access_token'] == 'ws-token'
+        mock_profile_token.assert_not_called()
+
+    @pytest.mark.parametrize('context, evicted', [
+        ({'http-code': 401}, True),
+        ({}, False),
+    ], ids=['unauthorized', 'network_error'])
+    def test_sql_connect_failure_evicts_only_on_401(self, context, evicted):
+        """Test that only a rejected token, not any connect failure, drops cached auth."""
+        from databricks.sql.exc import RequestError
+
+        credentials = {
+            'host': 'dev.cloud.databricks.com',
+            'http_path': '/sql/1.0/warehouses/abc',
+            'profile': 'dev'
+        }
+        main._token_cache['dev'] = ('tok', time.monotonic() + 3600)
+        with patch('main._active_snapshot', return_value=('dev', credentials)), \
+                patch('main._current_bearer', return_value='tok'), \
+                patch('databricks.sql.connect', side_effect=RequestError("failed", context)):
+            with pytest.raises(ValueError):
+                main.get_databricks_connection()
+
+        assert ('dev' not in main._token_cache) is evicted
+
+
+class TestDatabricksApiRequest:
+    """Test suite for databricks_api_request."""
+
+    @pytest.fixture
+    def token_env(self):
+        """Mock an active token-based environment."""
+        manager = MagicMock()
+        manager.get_active_credentials.return_value = {
+            'host': 'dev.cloud.databricks.com',
+            'http_path': '/sql/1.0/warehouses/abc',
+            'token': 'dapi_dev'
+        }
+        manager.get_active_environment_name.return_value = 'dev'
+        manager.get_active_snapshot.side_effect = lambda: (
+            manager.get_active_environment_name(), manager.get_active_credentials()
+        )
+        with patch('main.get_env_manager', return_value=manager):
+            yield manager
+
+    def test_get_uses_shared_session(self, token_env):
+        """Test that GET requests go through the pooled session with bearer auth."""
+        response = MagicMock()
+        response.json.return_value = {'jobs': []}
+        with patch.object(main._http, 'get', return_value=response) as mock_get:
+            assert main.databricks_api_request('jobs/list') == {'jobs': []}
+
+        url = mock_get.call_args.args[0]
+        headers = mock_get.call_args.kwargs['headers']
+        assert url == 'https://dev.cloud.databricks.com/api/2.0/jobs/list'
+        assert headers['Authorization'] == 'Bearer dapi_dev'
+
+    def test_get_sends_data_as_query_params(self, token_env):
+        """Test that GET request data is passed as query parameters."""
+        with patch.object(main._http, 'get') as mock_get:
+            main.databricks_api_request('jobs/runs/list', data={'job_id': 7})
+
+        assert mock_get.call_args.kwargs['params'] == {'job_id': 7}
+
+    def test_profile_reuses_workspace_client_auth(self, token_env):
+        """Test that profile environments take the bearer from the WorkspaceClient."""
+        token_env.get_active_credentials.return_value = {
+            'host': 'dev.cloud.databricks.com',
+            'http_path': '/sql/1.0/warehouses/abc',
+            'profile': 'dev'
+        }
+        client = MagicMock()
+        client.config.authenticate.return_value = {'Authorization': 'Bearer ws-token'}
+        with patch('main._workspace_for', return_value=client) as mock_workspace, \
+                patch('main.get_profile_token') as mock_profile_token, \
+                patch.object(main._http, 'get') as mock_get:
+            main.databricks_api_request('jobs/list')
+
+        assert mock_get.call_args.kwargs['headers']['Authorization'] == 'Bearer ws-token'
+        mock_profile_token.assert_not_called()
+        # The client comes from the request's own snapshot, not a second manager read
+        mock_workspace.assert_called_once_with(token_env.get_active_credentials.return_value)
+        token_env.get_active_snapshot.assert_called_once()
+
+    def test_profile_falls_back_when_client_fails(self, token_env):
+        """Test that a failing WorkspaceClient falls back to get_profile_token."""
+        token_env.get_active_credentials.return_value = {
+            'host': 'dev.cloud.databricks.com',
+            'http_path': '/sql/1.0/warehouses/abc',
+            'profile': 'dev'
+        }
+        with patch('main._workspace_for', side_effect=ValueError("no client")), \
+                patch('main.get_profile_token', return_value='cli-token'), \
+                patch.object(main._http, 'get') as mock_get:
+            main.databricks_api_request('jobs/list')
+
+        assert mock_get.call_args.kwargs['headers']['Authorization'] == 'Bearer cli-token'
+
+    def test_error_reports_environment_from_snapshot(self, token_env):
+        """Test that errors name the environment without asking the manager again."""
+        with patch.object(main._http, 'get', side_effect=ConnectionError("refused")):
+            with pytest.raises(ValueError, match="Current environment: dev"):
+                main.databricks_api_request('jobs/list')
+
+        token_env.get_active_snapshot.assert_called_once()
+
+    def test_unauthorized_evicts_profile_token(self, token_env):
+        """Test that a 401 drops the profile's cached CLI token and WorkspaceClient."""
+        credentials = {
+            'host': 'dev.cloud.databricks.com',
+            'http_path': '/sql/1.0/warehouses/abc',
+            'profile': 'dev'
+        }
+        token_env.get_active_credentials.return_value = credentials
+        main._token_cache['dev'] = ('stale-token', time.monotonic() + 3600)
+        response = MagicMock(status_code=401)
+        response.raise_for_status.side_effect = Exception("401 Unauthorized")
+        with patch('main._workspace', (tuple(sorted(credentials.items())), MagicMock())), \
+                patch('main._current_bearer', return_value='stale-token'), \
+                patch.object(main._http, 'get', return_value=response):
+            with pytest.raises(ValueError):
+                main.databricks_api_request('jobs/list')
+
+            assert main._workspace is None
+
+        assert 'dev' not in main._token_cache
+
+    def test_unauthorized_keeps_other_profiles_client(self, token_env):
+        """Test that evicting one profile leaves another profile's WorkspaceClient cached."""
+        other = (tuple(sorted({'host': 'h', 'http_path': 'p', 'profile': 'prod'}.items())), MagicMock())
+        with patch('main._workspace', other):
+            main._evict_profile_token('dev')
+
+            assert main._workspace is other
+
+    def test_unsupported_method_raises(self, token_env):
+        """Test that unknown HTTP methods are rejected with environment context."""
+        with pytest.raises(ValueError, match="Current environment: dev"):
+            main.databricks_api_request('jobs/list', method='DELETE')
+
+
+class TestRunSqlQuery:
+    """Test suite for run_sql_query result formatting."""
+
+    @pytest.fixture
+    def cursor(self):
+        """Mock a connection whose cursor returns itself from execute()."""
+        cursor = MagicMock()
+        cursor.execute.return_value = cursor
+        cursor.__enter__.return_value = cursor
+        conn = MagicMock()
+        conn.cursor.return_value = cursor
+        conn.__enter__.return_value = conn
+        with patch('main.get_databricks_connection', return_value=conn):
+            yield cursor
+
+    def test_rows_formatted_as_markdown_table(self, cursor):
+        """Test that every row becomes one markdown table line."""
+        cursor.description = [('id',), ('name',)]
+        cursor.fetchmany.side_effect = [[(1, 'a')], [(2, None)], []]
+
+        result = main.run_sql_query('SELECT id, name FROM t')
+
+        assert result == (
+            "| id | name |\n"
+            "| --- | --- |\n"
+            "| 1 | a |\n"
+            "| 2 | None |\n"
+        )
+
+    def test_empty_result(self, cursor):
+        """Test that a query with columns but no rows reports no results."""
+        cursor.description = [('id',)]
+        cursor.fetchmany.return_value = []
+
+        assert main.run_sql_query('SELECT id FROM t') == (
+            "Query executed successfully. No results returned."
+        )
+
+    def test_rows_capped_at_max(self, cursor):
+        """Test that results beyond the row cap are truncated with a marker."""
+        cursor.description = [('id',)]
+        cursor.fetchmany.side_effect = lambda size: [(0,)] * size
+
+        with patch('main._SQL_FETCH_SIZE', 2), patch('main._SQL_MAX_ROWS', 5):
+            result = main.run_sql_query('SELECT id FROM t')
+
+        assert result.count("| 0 |") == 5
+        assert result.endswith("| … truncated at 5 rows |\n")
+        assert cursor.arraysize == 2
+
+    def test_exact_max_rows_not_marked_truncated(self, cursor):
+        """Test that a result of exactly the cap has no truncation marker."""
+        cursor.description = [('id',)]
+        cursor.fetchmany.side_effect = [[(0,), (0,)], []]
+
+        with patch('main._SQL_MAX_ROWS', 2):
+            result = main.run_sql_query('SELECT id FROM t')
+
+        assert "truncated" not in result
+
+    def test_connection_closed_on_error(self, cursor):
+        """Test that a failing query still exits the cursor and connection contexts."""
+        cursor.execute.side_effect = RuntimeError("bad SQL")
+
+        result = main.run_sql_query('SELEC 1')
+
+        assert result == "Error executing query: bad SQL"
+        cursor.__exit__.assert_called_once()
+        main.get_databricks_connection.return_value.__exit__.assert_called_once()
+
+
+class TestJobCache:
+    """Test suite for the job metadata TTL cache."""
+
+    @pytest.fixture
+    def api(self):
+        """Mock the REST API and an active environment named 'dev'."""
+        manager = MagicMock()
+        manager.get_active_environment_name.return_value = 'dev'
+        manager.get_active_credentials.return_value = {'host': 'dev.cloud.databricks.com'}
+        manager.get_active_snapshot.side_effect = lambda: (
+            manager.get_active_environment_name(), manager.get_active_credentials()
+        )
+        with patch('main.get_env_manager', return_value=manager), \
+                patch('main.databricks_api_request') as mock_request:
+            mock_request.return_value = {'settings': {'name': 'etl'}}
+            mock_request.manager = manager
+            yield mock_request
+
+    def test_job_details_cached(self, api):
+        """Test that repeated get_job_details calls make one API request."""
+        assert "etl" in main.get_job_details(1)
+        assert "etl" in main.get_job_details(1)
+
+        api.assert_called_once()
+
+    def test_cache_keyed_by_environment(self, api):
+        """Test that another active environment does not reuse cached jobs."""
+        main.get_job_details(1)
+        api.manager.get_active_environment_name.return_value = 'prod'
+        main.get_job_details(1)
+
+        assert api.call_count == 2
+
+    def test_cache_keyed_by_host(self, api):
+        """Test that a reload repointing the environment refetches jobs."""
+        main.get_job_details(1)
+        api.manager.get_active_credentials.return_value = {'host': 'new.cloud.databricks.com'}
+        main.get_job_details(1)
+
+        assert api.call_count == 2
+
+    def test_cache_bounded(self, api):
+        """Test that the least recently used entries are evicted past the limit."""
+        with patch('main._JOB_CACHE_MAX', 2):
+            main.get_job_details(1)
+            main.get_job_details(2)
+            main.get_job_details(1)
+            main.get_job_details(3)
+
+        assert len(main._job_cache) == 2
+        assert [key[3] for key in main._job_cache] == [1, 3]
+
+    def test_expired_entries_pruned_first(self, api):
+        """Test that expired entries are dropped before live ones when full."""
+        with patch('main._JOB_CACHE_MAX', 2):
+            with patch('main.time.monotonic', return_value=1000.0):
+                main.get_job_details(2)
+                main.get_job_status(1)
+            with patch('main.time.monotonic', return_value=1016.0):
+                main.get_job_details(3)
+
+        assert [key[3] for key in main._job_cache] == [2, 3]
+
+    def test_expired_entry_refetched(self, api):
+        """Test that entries are fetched again once their TTL elapses."""
+        with patch('main.time.monotonic', return_value=1000.0):
+            main.get_job_status(1)
+        with patch('main.time.monotonic', return_value=1016.0):
+            main.get_job_status(1)
+
+        assert api.call_count == 2
+
+    def test_errors_not_cached(self, api):
+        """Test that a failed request is retried on the next call."""
+        api.side_effect = [ValueError("boom"), {'settings': {'name': 'etl'}}]
+
+        assert main.get_job_details(1).startswith("Error getting job details")
+        assert "etl" in main.get_job_details(1)
+
+    def test_task_types_listed(self, api):
+        """Test that each task's type is taken from its *_task key."""
+        api.return_value = {'settings': {'name': 'etl', 'tasks': [
+            {'task_key': 'ingest', 'notebook_task': {}, 'description': 'load'},
+            {'task_key': 'other'},
+            {'task_key': 'future', 'new_kind_task': {}},
+        ]}}
+
+        result = main.get_job_details(1)
+
+        assert "| ingest | notebook_task | load |" in result
+        assert "| other | N/A | N/A |" in result
+        assert "| future | new_kind_task | N/A |" in result
+
+    def test_switch_environment_invalidates(self, api):
+        """Test that switching environments clears cached job data."""
+        main.get_job_details(1)
+        with patch('main.switch_environment', return_value="ok"):
+            main.mcp_switch_environment('prod')
+        main.get_job_details(1)
+
+        assert api.call_count == 2
+
+
+class TestFormatEpochMs:
+    """Test suite for _format_epoch_ms."""
+
+    def test_formats_milliseconds(self):
+        """Test that millisecond timestamps are rendered in local time."""
+        ms = 1_700_000_000_000
+        expected = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(ms / 1000))
+
+        assert main._format_epoch_ms(ms) == expected
+
+    def test_missing_timestamp(self):
+        """Test that zero or missing timestamps render as N/A."""
+        assert main._format_epoch_ms(0) == "N/A"
+        assert main._format_epoch_ms(None) == "N/A"
+
+
+class TestGetJobsDetails:
+    """Test suite for get_jobs_details."""
+
+    @pytest.fixture
+    def manager(self):
+        """Mock the active environment that job cache entries are keyed on."""
+        manager = MagicMock()
+        manager.get_active_snapshot.return_value = ('dev', {'host': 'dev.cloud.databricks.com'})
+        with patch('main.get_env_manager', return_value=manager):
+            yield manager
+
+    def test_jobs_details_reports_each_job(self, manager):
+        """Test that one failing job does not hide the others."""
+        def fake_request(endpoint, method="GET", data=None):
+            if endpoint.endswith('=2'):
+                raise ValueError("not found")
+            return {'settings': {'name': 'etl'}}
+
+        with patch('main.databricks_api_request', side_effect=fake_request):
+            result = main.get_jobs_details([1, 2])
+
+        assert "## Job Details: etl" in result
+        assert "## Job 2\n\nError getting job details: not found" in result
+
+    def test_jobs_details_share_job_cache(self, manager):
+        """Test that jobs fetched by get_job_details aren't requested again."""
+        with patch('main.databricks_api_request',
+                   return_value={'settings': {'name': 'etl'}}) as mock_request:
+            main.get_job_details(1)
+            result = main.get_jobs_details([1])
+
+        assert "## Job Details: etl" in result
+        mock_request.assert_called_once()
+
+    def test_jobs_details_returns_error_string(self, manager):
+        """Test that a failure outside the per-job fetches is reported, not raised."""
+        with patch.object(main._api_executor, 'submit', side_effect=RuntimeError("shut down")):
+            result = main.get_jobs_details([1])
+
+        assert result == "Error getting job details: shut down"
+
+
+class TestGetWorkspaceClient:
+    """Test suite for get_workspace_client caching."""
+
+    @pytest.fixture
+    def manager(self):
+        """Mock a token-based active environment and reset the cached client."""
+        manager = MagicMock()
+        manager.get_active_credentials.return_value = {
+            'host': 'dev.cloud.databricks.com',
+            'http_path': '/sql/1.0/warehouses/abc',
+            'token': 'dapi_dev'
+        }
+        manager.get_active_snapshot.side_effect = lambda: (
+            'dev', manager.get_active_credentials()
+        )
+        with patch('main.get_env_manager', return_value=manager), \
+                patch('main._workspace', None):
+            yield manager
+
+    def test_client_reused_for_same_credentials(self, manager):
+        """Test that repeated calls construct one WorkspaceClient."""
+        with patch('main.WorkspaceClient') as mock_client:
+            first = main.get_workspace_client()
+            second = main.get_workspace_client()
+
+        assert first is second
+        mock_client.assert_called_once()
+
+    def test_client_replaced_after_switch(self, manager):
+        """Test that new credentials build a new WorkspaceClient."""
+        with patch('main.WorkspaceClient', side_effect=[MagicMock(), MagicMock()]):
+            first = main.get_workspace_client()
+            manager.get_active_credentials.return_value = {
+                'host': 'prod.cloud.databricks.com',
+                'http_path': '/sql/1.0/warehouses/xyz',
+                'token': 'dapi_prod'
+            }
+            second = main.get_workspace_client()
+
+        assert first is not second
+
+
+class TestGetEnvManager:
+    """Test suite for get_env_manager lazy initialization."""
+
+    def test_concurrent_first_calls_load_once(self):
+        """Test that racing first calls load the configuration only once."""
+        active = {'name': None}
+        manager = MagicMock()
+        manager.get_active_environment_name.side_effect = lambda: active['name']
+        manager.load_configuration.side_effect = lambda: time.sleep(0.05)
+        manager.set_active_to_default.side_effect = lambda: active.update(name='dev')
+        with patch('config.manager._manager', manager):
+            threads = [threading.Thread(target=main.get_env_manager) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        manager.load_configuration.assert_called_once()
+
+    def test_switch_through_tool_is_kept(self, tmp_path):
+        """Test that a switch made by the environment tool isn't undone on first use."""
+        yaml_file = os.path.join(os.path.dirname(__file__), '..', 'fixtures', 'test_environments.yaml')
+        manager = EnvironmentManager()
+        manager.load_configuration(yaml_file, str(tmp_path / '.env'))
+        manager.set_active_to_default()
+
+        with patch('config.manager._manager', manager), \
+                patch.object(manager, 'load_configuration') as mock_load:
+            main.mcp_switch_environment('prod')
+
+            assert main.get_env_manager() is manager
+            assert manager.get_active_environment_name() == 'prod'
+
+        mock_load.assert_not_called()
+
+
+class TestGetClusterConfig:
+    """Test suite for get_cluster_config."""
+
+    def _config(self):
+        return main.get_cluster_config(
+            cluster_name='mcp-test',
+            spark_version='15.4.x-scala2.12',
+            node_type='i3.xlarge',
+            min_workers=1,
+            max_workers=4,
+            user_email='user@example.com'
+        )
+
+    def test_template_and_arguments_combined(self):
+        """Test that fixed settings and caller arguments both appear."""
+        config = self._config()
+
+        assert config["kind"] == main.Kind.CLASSIC_PREVIEW
+        assert config["data_security_mode"] == main.DataSecurityMode.DATA_SECURITY_MODE_AUTO
+        assert config["spark_conf"] == {"spark.speculation": "true"}
+        assert config["cluster_name"] == 'mcp-test'
+        assert config["driver_node_type_id"] == 'i3.xlarge'
+        assert config["autoscale"].max_workers == 4
+
+    def test_template_not_mutated_through_result(self):
+        """Test that editing one config does not leak into the next."""
+        self._config()["custom_tags"]["Owner"] = 'someone'
+
+        assert self._config()["custom_tags"] == {"Project": "mcp-databricks-server"}
+
+    def test_missing_parameters_rejected(self):
+        """Test that blank required parameters raise ValueError."""
+        with pytest.raises(ValueError, match="Missing required configuration"):
+            main.get_cluster_config('', 'v', 'n', 1, 2, 'u@example.com')
+
+
+class TestGetSchema:
+    """Test suite for the get_schema table listing cache."""
+
+    @pytest.fixture
+    def cursor(self):
+        """Mock an active 'dev' environment and a connection listing one table."""
+        table = MagicMock(TABLE_CAT='main', TABLE_SCHEM='sales', TABLE_NAME='orders')
+        cursor = MagicMock()
+        cursor.__enter__.return_value = cursor
+        cursor.tables.return_value.fetchall.return_value = [table]
+        conn = MagicMock()
+        conn.cursor.return_value = cursor
+        conn.__enter__.return_value = conn
+        manager = MagicMock()
+        manager.get_active_environment_name.return_value = 'dev'
+        main._schema_cache.clear()
+        with patch('main.get_env_manager', return_value=manager), \
+                patch('main.get_databricks_connection', return_value=conn):
+            yield cursor
+        main._schema_cache.clear()
+
+    def test_listing_cached(self, cursor):
+        """Test that repeated reads within the TTL query the warehouse once."""
+        expected = "Database: main, Schema: sales, Table: orders"
+
+        assert main.get_schema() == expected
+        assert main.get_schema() == expected
+        cursor.tables.assert_called_once()
+
+    def test_refresh_clears_cache(self, cursor):
+        """Test that refresh_schema_cache forces a new query."""
+        main.get_schema()
+        main.refresh_schema_cache()
+        main.get_schema()
+
+        assert cursor.tables.call_count == 2
+
+    def test_errors_not_cached(self, cursor):
+        """Test that a failed listing is retried on the next read."""
+        cursor.tables.side_effect = [RuntimeError("warehouse down"), cursor.tables.return_value]
+
+        assert main.get_schema().startswith("Error retrieving tables")
+        assert main.get_schema() == "Database: main, Schema: sales, Table: orders"
+
+
+class TestListClusters:
+    """Test suite for list_clusters."""
+
+    def _cluster(self, cluster_id):
+        return MagicMock(
+            cluster_id=cluster_id, cluster_name='c', state=None,
+            spark_version='v', node_type_id='n', num_workers=2
+        )
+
+    def test_no_clusters(self):
+        """Test that an empty listing says so instead of returning a bare header."""
+        client = MagicMock()
+        client.clusters.list.return_value = iter([])
+        with patch('main.get_workspace_client', return_value=client):
+            assert main.list_clusters() == "No clusters found."
+
+    def test_rows_capped_with_trailer(self):
+        """Test that clusters beyond the cap are noted without listing them all."""
+        pulled = []
+
+        def listing():
+            for i in range(100):
+                pulled.append(i)
+                yield self._cluster(str(i))
+
+        client = MagicMock()
+        client.clusters.list.return_value = listing()
+        with patch('main.get_workspace_client', return_value=client), \
+                patch('main._LIST_MAX_ROWS', 3):
+            result = main.list_clusters()
+
+        assert result.count("| c | N/A | v | n | 2 |") == 3
+        assert result.endswith("\n… more clusters available (showing first 3)\n")
+        assert len(pulled) == 4
+
+    def test_no_trailer_at_exact_cap(self):
+        """Test that a listing exactly at the cap has no trailer."""
+        client = MagicMock()
+        client.clusters.list.return_value = iter([self._cluster(str(i)) for i in range(3)])
+        with patch('main.get_workspace_client', return_value=client), \
+                patch('main._LIST_MAX_ROWS', 3):
+            result = main.list_clusters()
+
+        assert result.count("| c | N/A | v | n | 2 |") == 3
+        assert "more clusters available" not in result
+
+
+class TestListJobs:
+    """Test suite for list_jobs."""
+
+    def test_rows_capped_with_trailer(self):
+        """Test that jobs beyond the cap are summarized as a count."""
+        jobs = [{'job_id': i, 'settings': {'name': 'j'}, 'created_by': 'u'} for i in range(4)]
+        with patch('main.databricks_api_request', return_value={'jobs': jobs}), \
+                patch('main._LIST_MAX_ROWS', 3):
+            result = main.list_jobs()
+
+        assert "| 2 | j | u |" in result
+        assert "| 3 | j | u |" not in result
+        assert result.endswith("\n… and 1 more\n")
@@ -0,0 +1,281 @@
+"""
+Unit tests for the config.manager module.
+
+Tests cover configuration loading, environment switching, and the
+reload path used by the file watcher.
+"""
+
+import os
+import shutil
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import config.manager
+from config.manager import EnvironmentManager, get_initialized_manager, get_manager
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), '..', 'fixtures')
+VALID_YAML = os.path.join(FIXTURES_DIR, 'test_environments.yaml')
+
+
+@pytest.fixture(autouse=True)
+def clear_parsed_cache():
+    """Keep the process-wide parsed configuration from leaking between tests."""
+    config.manager._parsed_cache = None
+    yield
+    config.manager._parsed_cache = None
+
+
+@pytest.fixture
+def yaml_file(tmp_path):
+    """Copy the valid fixture so tests can modify it freely."""
+    return str(shutil.copy(VALID_YAML, tmp_path / 'environments.yaml'))
+
+
+@pytest.fixture
+def manager(yaml_file, tmp_path):
+    """A manager loaded from the fixture with the default environment active."""
+    env_manager = EnvironmentManager()
+    env_manager.load_configuration(yaml_file, str(tmp_path / '.env'))
+    env_manager.set_active_to_default()
+    return env_manager
+
+
+class TestGetManager:
+    """Test suite for the shared manager accessor."""
+
+    def test_returns_same_instance(self):
+        """Test that every call returns the one shared manager."""
+        assert get_manager() is get_manager()
+        assert isinstance(get_manager(), EnvironmentManager)
+
+    def test_concurrent_first_use_loads_once(self):
+        """Test that racing first calls to get_initialized_manager load only once."""
+        active = {'name': None}
+        manager = MagicMock()
+        manager.get_active_environment_name.side_effect = lambda: active['name']
+        manager.load_configuration.side_effect = lambda: time.sleep(0.05)
+        manager.set_active_to_default.side_effect = lambda: active.update(name='dev')
+
+        with patch('config.manager._manager', manager):
+            threads = [threading.Thread(target=get_initialized_manager) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert get_initialized_manager() is manager
+
+        manager.load_configuration.assert_called_once()
+        manager.set_active_to_default.assert_called_once()
+
+
+class TestManagerStates:
+    """Test suite for accessor behavior before configuration and activation."""
+
+    def test_accessors_before_load(self):
+        """Test that a fresh manager reports no environment and refuses to switch."""
+        env_manager = EnvironmentManager()
+
+        assert env_manager._configuration is None
+        assert env_manager.get_active_environment_name() is None
+        with pytest.raises(RuntimeError, match="Configuration not loaded"):
+            env_manager.switch_to_environment('dev')
+        with pytest.raises(RuntimeError, match="Configuration not loaded"):
+            env_manager.list_all_environments()
+        with pytest.raises(RuntimeError, match="No active environment set"):
+            env_manager.get_active_credentials()
+
+    def test_accessors_after_load_before_activation(self, yaml_file, tmp_path):
+        """Test that environments are listed but no credentials exist until activation."""
+        env_manager = EnvironmentManager()
+        env_manager.load_configuration(yaml_file, str(tmp_path / '.env'))
+
+        assert sorted(env_manager.list_all_environments()) == ['dev', 'prod', 'staging']
+        assert env_manager.get_active_environment_name() is None
+        with pytest.raises(RuntimeError, match="No active environment set"):
+            env_manager.get_active_environment_info()
+
+    def test_listed_environments_not_shared(self, yaml_file, tmp_path):
+        """Test that changing one manager's listing leaves the shared configuration alone."""
+        first = EnvironmentManager()
+        first.load_configuration(yaml_file, str(tmp_path / '.env'))
+        second = EnvironmentManager()
+        second.load_configuration(yaml_file, str(tmp_path / '.env'))
+
+        first.list_all_environments().pop('prod')
+
+        assert 'prod' in first.list_all_environments()
+        assert 'prod' in second.list_all_environments()
+        second.switch_to_environment('prod')
+
+
+class TestEnvironmentSwitching:
+    """Test suite for switching the active environment."""
+
+    def test_default_environment_is_active(self, manager):
+        """Test that the configured default becomes the active environment."""
+        assert manager.get_active_environment_name() == 'dev'
+        assert manager.get_active_credentials()['host'] == 'dev-workspace.cloud.databricks.com'
+
+    def test_active_environment_info(self, manager):
+        """Test that the summary includes the activation timestamp."""
+        info = manager.get_active_environment_info()
+
+        assert info.startswith("Environment: dev\n")
+        assert "Activated: " in info
+
+    def test_active_environment_info_reused_until_switch(self, manager):
+        """Test that the summary is formatted once per activation, not per call."""
+        first = manager.get_active_environment_info()
+
+        assert manager.get_active_environment_info() is first
+
+        manager.switch_to_environment('dev')
+        assert manager.get_active_environment_info() is not first
+
+    def test_credentials_returned_as_copies(self, manager):
+        """Test that changing returned credentials doesn't affect the environment."""
+        first = manager.get_active_credentials()
+        first['host'] = 'elsewhere.cloud.databricks.com'
+
+        assert manager.get_active_credentials()['host'] == 'dev-workspace.cloud.databricks.com'
+        assert manager.get_active_snapshot()[1]['host'] == 'dev-workspace.cloud.databricks.com'
+
+    def test_switch_to_existing_environment(self, manager):
+        """Test switching updates the active credentials and returns details."""
+        message = manager.switch_to_environment('prod')
+
+        assert message.startswith("✓ Switched to environment: prod")
+        assert "Tags: production, critical" in message
+        assert manager.get_active_environment_name() == 'prod'
+        assert manager.get_active_credentials()['token'] == 'dapi_prod_token_789012'
+
+    def test_active_snapshot_matches_accessors(self, manager):
+        """Test that the snapshot pairs the active name with its credentials."""
+        manager.switch_to_environment('staging')
+
+        name, credentials = manager.get_active_snapshot()
+
+        assert name == 'staging'
+        assert credentials == manager.get_active_credentials()
+
+    def test_switch_to_unknown_environment_raises(self, manager):
+        """Test that switching to an unknown environment lists the available ones."""
+        with pytest.raises(ValueError, match="Available environments: dev, prod, staging"):
+            manager.switch_to_environment('missing')
+
+        assert manager.get_active_environment_name() == 'dev'
+
+
+class TestParsedConfigurationCache:
+    """Test suite for reusing parsed configuration across managers."""
+
+    def test_second_manager_reuses_parse(self, yaml_file, tmp_path):
+        """Test that unchanged files are parsed once for several managers."""
+        with patch(
+            'config.manager.auto_load_configuration',
+            wraps=config.manager.auto_load_configuration
+        ) as mock_load:
+            for _ in range(2):
+                EnvironmentManager().load_configuration(yaml_file, str(tmp_path / '.env'))
+
+        mock_load.assert_called_once()
+
+    def test_changed_file_parsed_again(self, yaml_file, tmp_path):
+        """Test that editing the YAML invalidates the cached parse."""
+        first = EnvironmentManager()
+        first.load_configuration(yaml_file, str(tmp_path / '.env'))
+        with open(yaml_file, 'a') as f:
+            f.write('\n# edited\n')
+
+        second = EnvironmentManager()
+        second.load_configuration(yaml_file, str(tmp_path / '.env'))
+
+        assert second._configuration is not first._configuration
+
+
+class TestLoadConfiguration:
+    """Test suite for load_configuration with an active environment."""
+
+    def test_load_keeps_active_environment(self, manager, yaml_file, tmp_path):
+        """Test that loading again doesn't drop an environment that still exists."""
+        manager.switch_to_environment('prod')
+
+        manager.load_configuration(yaml_file, str(tmp_path / '.env'))
+
+        assert manager.get_active_environment_name() == 'prod'
+        assert manager.get_active_credentials()['token'] == 'dapi_prod_token_789012'
+
+    def test_load_clears_removed_active_environment(self, manager, yaml_file, tmp_path):
+        """Test that an active environment missing from the new file is cleared."""
+        manager.switch_to_environment('staging')
+        with open(yaml_file) as f:
+            content = f.read()
+        with open(yaml_file, 'w') as f:
+            f.write(content[:content.index('  staging:')])
+
+        manager.load_configuration(yaml_file, str(tmp_path / '.env'))
+
+        assert manager.get_active_environment_name() is None
+
+
+class TestReloadConfiguration:
+    """Test suite for reload_configuration."""
+
+    def test_reload_skipped_when_files_unchanged(self, manager, yaml_file, tmp_path):
+        """Test that an unchanged configuration is not parsed again."""
+        with patch('config.manager.auto_load_configuration') as mock_load:
+            manager.reload_configuration(yaml_file, str(tmp_path / '.env'))
+
+        mock_load.assert_not_called()
+
+    def test_reload_picks_up_changes(self, manager, yaml_file, tmp_path):
+        """Test that an edited configuration replaces the active environment's settings."""
+        with open(yaml_file) as f:
+            content = f.read()
+        with open(yaml_file, 'w') as f:
+            f.write(content.replace('dev-workspace', 'dev2-workspace'))
+
+        manager.reload_configuration(yaml_file, str(tmp_path / '.env'))
+
+        assert manager.get_active_environment_name() == 'dev'
+        assert manager.get_active_credentials()['host'] == 'dev2-workspace.cloud.databricks.com'
+
+    def test_reload_keeps_unchanged_active_environment(self, manager, yaml_file, tmp_path):
+        """Test that editing another environment keeps the active activation intact."""
+        activated_ns = manager._state.active_environment.activated_ns
+        with open(yaml_file) as f:
+            content = f.read()
+        with open(yaml_file, 'w') as f:
+            f.write(content.replace('prod-workspace', 'prod2-workspace'))
+
+        manager.reload_configuration(yaml_file, str(tmp_path / '.env'))
+
+        assert manager._state.active_environment.activated_ns == activated_ns
+        assert manager.list_all_environments()['prod'].host == 'prod2-workspace.cloud.databricks.com'
+
+    def test_reload_never_exposes_inactive_state(self, yaml_file, tmp_path):
+        """Test that a reload which resets the active environment swaps state in one step."""
+        states = []
+
+        class RecordingManager(EnvironmentManager):
+            def __setattr__(self, name, value):
+                if name == '_state':
+                    states.append(value)
+                super().__setattr__(name, value)
+
+        manager = RecordingManager()
+        manager.load_configuration(yaml_file, str(tmp_path / '.env'))
+        manager.switch_to_environment('staging')
+        with open(yaml_file) as f:
+            content = f.read()
+        with open(yaml_file, 'w') as f:
+            f.write(content[:content.index('  staging:')])
+        del states[:]
+
+        manager.reload_configuration(yaml_file, str(tmp_path / '.env'))
+
+        assert manager.get_active_environment_name() == 'dev'
+        assert [state.get_name() for state in states] == ['dev']
@@ -8,11 +8,6 @@ by attempting to load the configuration and initialize connections.
 
 import unittest
 from unittest.mock import patch, MagicMock
-import sys
-import os
-
-# Add the project root to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from config.manager import EnvironmentManager
 from utils.logger import logger
@@ -21,6 +16,16 @@ from utils.logger import logger
 class TestProfileAuth(unittest.TestCase):
     """Test cases for profile-based authentication functionality."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Load the configuration once and share the manager across tests."""
+        try:
+            cls.shared_manager = EnvironmentManager()
+            cls.shared_manager.load_configuration()
+            cls.shared_manager.set_active_to_default()
+        except Exception as e:
+            raise unittest.SkipTest(f"Could not load environment configuration: {e}")
+    
     def setUp(self):
         """Set up test fixtures before each test method."""
         self.env_manager = None
@@ -54,8 +59,7 @@ class TestProfileAuth(unittest.TestCase):
     
     def test_set_active_to_default(self):
         """Test setting active environment to default."""
-        self.env_manager = EnvironmentManager()
-        self.env_manager.load_configuration()
+        self.env_manager = self.shared_manager
         
         try:
             self.env_manager.set_active_to_default()
@@ -66,9 +70,7 @@ class TestProfileAuth(unittest.TestCase):
     
     def test_get_active_environment_name(self):
         """Test getting the active environment name."""
-        self.env_manager = EnvironmentManager()
-        self.env_manager.load_configuration()
-        self.env_manager.set_active_to_default()
+        self.env_manager = self.shared_manager
         
         try:
             active_name = self.env_manager.get_active_environment_name()
@@ -79,9 +81,7 @@ class TestProfileAuth(unittest.TestCase):
     
     def test_get_active_credentials(self):
         """Test getting active environment credentials."""
-        self.env_manager = EnvironmentManager()
-        self.env_manager.load_configuration()
-        self.env_manager.set_active_to_default()
+        self.env_manager = self.shared_manager
         
         try:
             credentials = self.env_manager.get_active_credentials()
@@ -102,8 +102,7 @@ class TestProfileAuth(unittest.TestCase):
     
     def test_list_all_environments(self):
         """Test listing all available environments."""
-        self.env_manager = EnvironmentManager()
-        self.env_manager.load_configuration()
+        self.env_manager = self.shared_manager
         
         try:
             all_envs = self.env_manager.list_all_environments()
@@ -120,8 +119,7 @@ class TestProfileAuth(unittest.TestCase):
     
     def test_environment_switching(self):
         """Test switching between environments."""
-        self.env_manager = EnvironmentManager()
-        self.env_manager.load_configuration()
+        self.env_manager = self.shared_manager
         
         try:
             all_envs = self.env_manager.list_all_environments()
@@ -146,8 +144,7 @@ class TestProfileAuth(unittest.TestCase):
     
     def test_environment_configuration_structure(self):
         """Test that environment configuration has expected structure."""
-        self.env_manager = EnvironmentManager()
-        self.env_manager.load_configuration()
+        self.env_manager = self.shared_manager
         
         try:
             all_envs = self.env_manager.list_all_environments()
@@ -6,284 +6,97 @@ including edge cases for empty, None, and whitespace-only values.
 """
 
 import pytest
-from typing import List, Optional
-from unittest.mock import Mock
+from typing import List, Optional, Tuple
+from types import SimpleNamespace
 
-from config.validator import validate_credentials_complete, get_validation_error_message
-from models.environment import EnvironmentConfig
+from config.validator import (
+    get_validation_error_message,
+    validate_credentials_complete,
+)
 
 
-class TestValidateCredentialsComplete:
-    """Test suite for validate_credentials_complete function."""
-
-    def test_valid_credentials_all_fields_present(self):
-        """Test that validation passes when all required fields are present and non-empty."""
-        # Arrange
-        env = Mock(spec=EnvironmentConfig)
-        env.host = "dev.cloud.databricks.com"
-        env.token = "dapi123456789"
-        env.http_path = "/sql/1.0/warehouses/abc123"
-
-        # Act
-        is_valid, missing_fields = validate_credentials_complete(env)
-
-        # Assert
-        assert is_valid is True
-        assert missing_fields is None
-
-    def test_valid_credentials_with_whitespace_surrounding(self):
-        """Test that validation passes when fields have surrounding whitespace but contain content."""
-        # Arrange
-        env = Mock(spec=EnvironmentConfig)
-        env.host = "  dev.cloud.databricks.com  "
-        env.token = "  dapi123456789  "
-        env.http_path = "  /sql/1.0/warehouses/abc123  "
-
-        # Act
-        is_valid, missing_fields = validate_credentials_complete(env)
-
-        # Assert
-        assert is_valid is True
-        assert missing_fields is None
-
-    def test_invalid_credentials_host_is_none(self):
-        """Test that validation fails when host is None."""
-        # Arrange
-        env = Mock(spec=EnvironmentConfig)
-        env.host = None
-        env.token = "dapi123456789"
-        env.http_path = "/sql/1.0/warehouses/abc123"
-
-        # Act
-        is_valid, missing_fields = validate_credentials_complete(env)
-
-        # Assert
-        assert is_valid is False
-        assert missing_fields == ['host']
-
-    def test_invalid_credentials_host_is_empty_string(self):
-        """Test that validation fails when host is an empty string."""
-        # Arrange
-        env = Mock(spec=EnvironmentConfig)
-        env.host = ""
-        env.token = "dapi123456789"
-        env.http_path = "/sql/1.0/warehouses/abc123"
-
-        # Act
-        is_valid, missing_fields = validate_credentials_complete(env)
-
-        # Assert
-        assert is_valid is False
-        assert missing_fields == ['host']
-
-    def test_invalid_credentials_host_is_whitespace_only(self):
-        """Test that validation fails when host contains only whitespace."""
-        # Arrange
-        env = Mock(spec=EnvironmentConfig)
-        env.host = "   "
-        env.token = "dapi123456789"
-        env.http_path = "/sql/1.0/warehouses/abc123"
-
-        # Act
-        is_valid, missing_fields = validate_credentials_complete(env)
-
-        # Assert
-        assert is_valid is False
-        assert missing_fields == ['host']
-
-    def test_invalid_credentials_token_is_none(self):
-        """Test that validation fails when token is None."""
-        # Arrange
-        env = Mock(spec=EnvironmentConfig)
-        env.host = "dev.cloud.databricks.com"
-        env.token = None
-        env.http_path = "/sql/1.0/warehouses/abc123"
-
-        # Act
-        is_valid, missing_fields = validate_credentials_complete(env)
-
-        # Assert
-        assert is_valid is False
-        assert missing_fields == ['token']
-
-    def test_invalid_credentials_token_is_empty_string(self):
-        """Test that validation fails when token is an empty string."""
-        # Arrange
-        env = Mock(spec=EnvironmentConfig)
-        env.host = "dev.cloud.databricks.com"
-        env.token = ""
-        env.http_path = "/sql/1.0/warehouses/abc123"
-
-        # Act
-        is_valid, missing_fields = validate_credentials_complete(env)
-
-        # Assert
-        assert is_valid is False
-        assert missing_fields == ['token']
-
-    def test_invalid_credentials_token_is_whitespace_only(self):
-        """Test that validation fails when token contains only whitespace."""
-        # Arrange
-        env = Mock(spec=EnvironmentConfig)
-        env.host = "dev.cloud.databricks.com"
-        env.token = "\t\n  "
-        env.http_path = "/sql/1.0/warehouses/abc123"
-
-        # Act
-        is_valid, missing_fields = validate_credentials_complete(env)
-
-        # Assert
-        assert is_valid is False
-        assert missing_fields == ['token']
+def _env(host=None, token=None, http_path=None, name='dev'):
+    """Build a stand-in environment; the validator only reads these attributes."""
+    return SimpleNamespace(host=host, token=token, http_path=http_path, name=name)
 
-    def test_invalid_credentials_http_path_is_none(self):
-        """Test that validation fails when http_path is None."""
-        # Arrange
-        env = Mock(spec=EnvironmentConfig)
-        env.host = "dev.cloud.databricks.com"
-        env.token = "dapi123456789"
-        env.http_path = None
-
-        # Act
-        is_valid, missing_fields = validate_credentials_complete(env)
-
-        # Assert
-        assert is_valid is False
-        assert missing_fields == ['http_path']
-
-    def test_invalid_credentials_http_path_is_empty_string(self):
-        """Test that validation fails when http_path is an empty string."""
-        # Arrange
-        env = Mock(spec=EnvironmentConfig)
-        env.host = "dev.cloud.databricks.com"
-        env.token = "dapi123456789"
-        env.http_path = ""
-
-        # Act
-        is_valid, missing_fields = validate_credentials_complete(env)
-
-        # Assert
-        assert is_valid is False
-        assert missing_fields == ['http_path']
-
-    def test_invalid_credentials_http_path_is_whitespace_only(self):
-        """Test that validation fails when http_path contains only whitespace."""
-        # Arrange
-        env = Mock(spec=EnvironmentConfig)
-        env.host = "dev.cloud.databricks.com"
-        env.token = "dapi123456789"
-        env.http_path = "     "
-
-        # Act
-        is_valid, missing_fields = validate_credentials_complete(env)
-
-        # Assert
-        assert is_valid is False
-        assert missing_fields == ['http_path']
-
-    def test_invalid_credentials_multiple_fields_missing(self):
-        """Test that validation fails and lists all missing fields when multiple are invalid."""
-        # Arrange
-        env = Mock(spec=EnvironmentConfig)
-        env.host = ""
-        env.token = None
-        env.http_path = "  "
-
-        # Act
-        is_valid, missing_fields = validate_credentials_complete(env)
-
-        # Assert
-        assert is_valid is False
-        assert missing_fields == ['host', 'token', 'http_path']
-
-    def test_invalid_credentials_host_and_token_missing(self):
-        """Test that validation fails when host and token are missing."""
-        # Arrange
-        env = Mock(spec=EnvironmentConfig)
-        env.host = None
-        env.token = ""
-        env.http_path = "/sql/1.0/warehouses/abc123"
 
-        # Act
-        is_valid, missing_fields = validate_credentials_complete(env)
-
-        # Assert
-        assert is_valid is False
-        assert missing_fields == ['host', 'token']
-
-    def test_invalid_credentials_host_and_http_path_missing(self):
-        """Test that validation fails when host and http_path are missing."""
-        # Arrange
-        env = Mock(spec=EnvironmentConfig)
-        env.host = "   "
-        env.token = "dapi123456789"
-        env.http_path = None
-
-        # Act
-        is_valid, missing_fields = validate_credentials_complete(env)
-
-        # Assert
-        assert is_valid is False
-        assert missing_fields == ['host', 'http_path']
-
-    def test_invalid_credentials_token_and_http_path_missing(self):
-        """Test that validation fails when token and http_path are missing."""
-        # Arrange
-        env = Mock(spec=EnvironmentConfig)
-        env.host = "dev.cloud.databricks.com"
-        env.token = ""
-        env.http_path = "  "
-
-        # Act
-        is_valid, missing_fields = validate_credentials_complete(env)
-
-        # Assert
-        assert is_valid is False
-        assert missing_fields == ['token', 'http_path']
-
-    def test_invalid_credentials_all_fields_none(self):
-        """Test that validation fails when all fields are None."""
-        # Arrange
-        env = Mock(spec=EnvironmentConfig)
-        env.host = None
-        env.token = None
-        env.http_path = None
-
-        # Act
-        is_valid, missing_fields = validate_credentials_complete(env)
-
-        # Assert
-        assert is_valid is False
-        assert missing_fields == ['host', 'token', 'http_path']
+class TestValidateCredentialsComplete:
+    """Test suite for validate_credentials_complete function."""
 
-    def test_invalid_credentials_all_fields_empty(self):
-        """Test that validation fails when all fields are empty strings."""
+    _HOST = "dev.cloud.databricks.com"
+    _TOKEN = "dapi123456789"
+    _HTTP_PATH = "/sql/1.0/warehouses/abc123"
+
+    @pytest.mark.parametrize("host,token,http_path,expected_valid,expected_missing", [
+        (_HOST, _TOKEN, _HTTP_PATH, True, ()),
+        (f"  {_HOST}  ", f"  {_TOKEN}  ", f"  {_HTTP_PATH}  ", True, ()),
+        (None, _TOKEN, _HTTP_PATH, False, ('host',)),
+        ("", _TOKEN, _HTTP_PATH, False, ('host',)),
+        ("   ", _TOKEN, _HTTP_PATH, False, ('host',)),
+        (_HOST, None, _HTTP_PATH, False, ('token',)),
+        (_HOST, "", _HTTP_PATH, False, ('token',)),
+        (_HOST, "\t\n  ", _HTTP_PATH, False, ('token',)),
+        (_HOST, _TOKEN, None, False, ('http_path',)),
+        (_HOST, _TOKEN, "", False, ('http_path',)),
+        (_HOST, _TOKEN, "     ", False, ('http_path',)),
+        ("", None, "  ", False, ('host', 'token', 'http_path')),
+        (None, "", _HTTP_PATH, False, ('host', 'token')),
+        ("   ", _TOKEN, None, False, ('host', 'http_path')),
+        (_HOST, "", "  ", False, ('token', 'http_path')),
+        (None, None, None, False, ('host', 'token', 'http_path')),
+        ("", "", "", False, ('host', 'token', 'http_path')),
+    ], ids=[
+        "all_fields_present",
+        "whitespace_surrounding",
+        "host_none",
+        "host_empty",
+        "host_whitespace_only",
+        "token_none",
+        "token_empty",
+        "token_whitespace_only",
+        "http_path_none",
+        "http_path_empty",
+        "http_path_whitespace_only",
+        "multiple_fields_missing",
+        "host_and_token_missing",
+        "host_and_http_path_missing",
+        "token_and_http_path_missing",
+        "all_fields_none",
+        "all_fields_empty",
+    ])
+    def test_validate_credentials(
+        self,
+        host: Optional[str],
+        token: Optional[str],
+        http_path: Optional[str],
+        expected_valid: bool,
+        expected_missing: Tuple[str, ...]
+    ):
+        """Test validation of present, empty, None, and whitespace-only field combinations."""
         # Arrange
-        env = Mock(spec=EnvironmentConfig)
-        env.host = ""
-        env.token = ""
-        env.http_path = ""
+        env = _env(host=host, token=token, http_path=http_path)
 
         # Act
         is_valid, missing_fields = validate_credentials_complete(env)
 
         # Assert
-        assert is_valid is False
-        assert missing_fields == ['host', 'token', 'http_path']
+        assert is_valid is expected_valid
+        assert missing_fields == expected_missing
 
     def test_missing_fields_order_is_consistent(self):
         """Test that missing fields are returned in a consistent order."""
         # Arrange
-        env = Mock(spec=EnvironmentConfig)
-        env.host = ""
-        env.token = ""
-        env.http_path = ""
+        env = _env(
+            host="",
+            token="",
+            http_path="",
+        )
 
         # Act
         _, missing_fields = validate_credentials_complete(env)
 
         # Assert - fields should be in the order: host, token, http_path
-        assert missing_fields == ['host', 'token', 'http_path']
+        assert missing_fields == ('host', 'token', 'http_path')
 
 
 class TestGetValidationErrorMessage:
@@ -432,11 +245,12 @@ class TestValidatorIntegration:
     def test_validation_flow_invalid_to_error_message(self):
         """Test the typical flow from validation to error message generation."""
         # Arrange
-        env = Mock(spec=EnvironmentConfig)
-        env.name = "dev"
-        env.host = ""
-        env.token = None
-        env.http_path = "  "
+        env = _env(
+            name="dev",
+            host="",
+            token=None,
+            http_path="  ",
+        )
 
         # Act - Validate
         is_valid, missing_fields = validate_credentials_complete(env)
@@ -455,18 +269,19 @@ class TestValidatorIntegration:
     def test_validation_flow_partial_credentials(self):
         """Test validation flow with partially complete credentials."""
         # Arrange
-        env = Mock(spec=EnvironmentConfig)
-        env.name = "production"
-        env.host = "prod.cloud.databricks.com"
-        env.token = ""  # Missing token
-        env.http_path = "/sql/1.0/warehouses/prod123"
+        env = _env(
+            name="production",
+            host="prod.cloud.databricks.com",
+            token="",  # Missing token
+            http_path="/sql/1.0/warehouses/prod123",
+        )
 
         # Act - Validate
         is_valid, missing_fields = validate_credentials_complete(env)
 
         # Assert - Only token is missing
         assert is_valid is False
-        assert missing_fields == ['token']
+        assert missing_fields == ('token',)
 
         # Act - Generate error message
         error_message = get_validation_error_message(env.name, missing_fields)
@@ -478,18 +293,19 @@ class TestValidatorIntegration:
     def test_validation_flow_valid_credentials_no_error_message_needed(self):
         """Test that valid credentials don't require error message generation."""
         # Arrange
-        env = Mock(spec=EnvironmentConfig)
-        env.name = "staging"
-        env.host = "staging.cloud.databricks.com"
-        env.token = "dapi_valid_token"
-        env.http_path = "/sql/1.0/warehouses/staging456"
+        env = _env(
+            name="staging",
+            host="staging.cloud.databricks.com",
+            token="dapi_valid_token",
+            http_path="/sql/1.0/warehouses/staging456",
+        )
 
         # Act
         is_valid, missing_fields = validate_credentials_complete(env)
 
         # Assert - No error message needed
         assert is_valid is True
-        assert missing_fields is None
+        assert not missing_fields
 
     @pytest.mark.parametrize("env_name,missing_fields", [
         ("dev", ["host"]),
@@ -2,7 +2,7 @@
 MCP tool for getting the currently active Databricks environment.
 """
 
-from config.manager import EnvironmentManager
+from config.manager import get_initialized_manager
 from utils.logger import logger
 
 
@@ -28,13 +28,7 @@ def get_current_environment() -> str:
         RuntimeError: If no environment is active (should not happen in normal operation)
     """
     try:
-        env_manager = EnvironmentManager()
-        
-        # Initialize if not already done
-        if env_manager._configuration is None:
-            logger.info("Environment manager not initialized, initializing now...")
-            env_manager.load_configuration()
-            env_manager.set_active_to_default()
+        env_manager = get_initialized_manager()
         
         return env_manager.get_active_environment_info()
     except Exception as e:
@@ -43,4 +37,4 @@ def get_current_environment() -> str:
             f"Error getting current environment: {str(e)}\n"
             "Please ensure your environments.yaml or .env file is properly configured."
         )
-        raise RuntimeError(error_msg)
\ No newline at end of file
+        raise RuntimeError(error_msg) from e
\ No newline at end of file
@@ -2,7 +2,7 @@
 MCP tool for switching the active Databricks environment.
 """
 
-from config.manager import EnvironmentManager
+from config.manager import get_initialized_manager
 from utils.logger import logger
 
 
@@ -30,16 +30,10 @@ def switch_environment(name: str) -> str:
         ValueError: If environment doesn't exist or has invalid credentials
     """
     try:
-        env_manager = EnvironmentManager()
-        
-        # Initialize if not already done
-        if env_manager._configuration is None:
-            logger.info("Environment manager not initialized, initializing now...")
-            env_manager.load_configuration()
-            env_manager.set_active_to_default()
+        env_manager = get_initialized_manager()
         
         result = env_manager.switch_to_environment(name)
         return result
     except Exception as e:
         logger.error(f"Failed to switch environment: {e}")
-        raise ValueError(str(e))
\ No newline at end of file
+        raise ValueError(str(e)) from e
\ No newline at end of file
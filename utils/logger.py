@@ -5,14 +5,20 @@ Provides structured logging with appropriate levels for environment operations,
 configuration changes, and error handling.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 
 def setup_logger(name: str = 'databricks_mcp.environment') -> logging.Logger:
     """
     Set up a logger with structured formatting for environment operations.
 
+    Records are queued and written by a background listener thread, so
+    logging calls on the request path don't block on console I/O.
+
     Args:
         name: Logger name (default: databricks_mcp.environment)
 
@@ -35,7 +41,14 @@ def setup_logger(name: str = 'databricks_mcp.environment') -> logging.Logger:
         )
         handler.setFormatter(formatter)
 
-        logger.addHandler(handler)
+        # Hand records to a listener thread; it is stopped (and the queue
+        # flushed) at interpreter exit
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+
+        logger.addHandler(QueueHandler(log_queue))
 
     return logger
 
@@ -58,5 +71,18 @@ def mask_token(token: str) -> str:
     return f"{token[:8]}..."
 
 
-# Create default logger instance
-logger = setup_logger()
+def configure_logging() -> logging.Logger:
+    """
+    Attach the console handler to the default environment logger.
+
+    Called once from the server entry point; safe to call again.
+
+    Returns:
+        Configured default logger instance
+    """
+    return setup_logger(logger.name)
+
+
+# Default logger instance; handlers are attached by configure_logging()
+# so importing this module has no side effects
+logger = logging.getLogger('databricks_mcp.environment')